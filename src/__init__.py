@@ -9,7 +9,16 @@ from the SCAG 2024 Activity-Based Model for Interstate 5.
 __version__ = "1.0.0"
 __author__ = "Yu-Jen Chen"
 
-from .data_loader import DataLoader
+
+def __getattr__(name):
+    # Import DataLoader on first access so `import src` (or src.config) does not
+    # pull in pandas/numpy, e.g. for a quick installation check
+    if name == "DataLoader":
+        from .data_loader import DataLoader
+
+        return DataLoader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # TODO: Import these modules as they are implemented
 # from .aadt_calculator import AADTCalculator
@@ -30,25 +30,55 @@ class AADTCalculator:
 
         Args:
             df: DataFrame containing segment traffic data
+
+        Note:
+            Only a shallow copy of df is taken. Columns are added or replaced
+            with self.df[col] = ..., which swaps in new arrays rather than
+            writing into the caller's, so the caller's frame is unchanged.
         """
-        self.df = df.copy()
+        self.df = df.copy(deep=False)
         self.results = {}
 
+        # Low-cardinality keys as categoricals so masks and groupby use int codes
+        for col in (config.DIRECTION_FIELD, config.TYPE_FIELD):
+            if col in self.df.columns:
+                self.df[col] = self.df[col].astype("category")
+
+        self._reset_group_caches()
+
     def calculate_segment_aadt(self) -> pd.DataFrame:
         """
         Calculate AADT for each section
         """
         log_analysis_step("AADTCalculator", "Starting segment AADT calculation")
         total_aadt, auto_aadt, truck_aadt = calculate_aadt(self.df)
+
+        # Store AADT as int32 when the volumes are integer counts that fit
+        # (SCAG daily volumes are far below 2**31), halving memory traffic
+        if (
+            np.issubdtype(total_aadt.dtype, np.integer)
+            and total_aadt.max() <= np.iinfo(np.int32).max
+        ):
+            total_aadt = total_aadt.astype(np.int32)
+            auto_aadt = auto_aadt.astype(np.int32)
+            truck_aadt = truck_aadt.astype(np.int32)
+
+        # Only divide where TOTAL_AADT > 0; other segments keep 0.
+        # Reuse the computed arrays rather than re-reading the new columns.
+        total = total_aadt.to_numpy()
+        truck = truck_aadt.to_numpy()
+        pct = np.zeros_like(total, dtype=np.float64)
+        np.divide(truck, total, out=pct, where=total > 0)
+        pct *= 100
+
+        # Set the AADT columns one by one; assign() would copy the whole frame
         self.df["TOTAL_AADT"] = total_aadt
         self.df["AUTO_AADT"] = auto_aadt
         self.df["TRUCK_AADT"] = truck_aadt
+        self.df["TRUCK_PCT"] = pct
 
-        self.df["TRUCK_PCT"] = np.where(
-            self.df["TOTAL_AADT"] > 0,
-            (self.df["TRUCK_AADT"] / self.df["TOTAL_AADT"]) * 100,
-            0,
-        )
+        # New columns invalidate the cached grouping and group results
+        self._reset_group_caches()
 
         is_valid, errors = validate_data(self.df, "TOTAL_AADT", "aadt")
         if not is_valid:
@@ -62,6 +92,9 @@ class AADTCalculator:
         """
         Calculate avg AADT for a specific section (direction & facility_type)
 
+        Kept for API compatibility: the statistics come from the single
+        groupby aggregation shared with calculate_all_groups().
+
         Args:
         direction (str): N, S, E, W
         facility_type (str): ML, HV
@@ -80,35 +113,78 @@ class AADTCalculator:
         }
         """
 
-        mask = (self.df[config.DIRECTION_FIELD] == direction) & (
-            self.df[config.TYPE_FIELD] == facility_type
-        )
-        group_df = self.df[mask]
+        group_stats = self._aggregate_groups()
+        key = (direction, facility_type)
 
-        if len(group_df) == 0:
+        if key not in group_stats.index:
             logger.warning(f"no data for {direction}-{facility_type}")
             return None
 
+        row = group_stats.loc[key]
         result = {
             "direction": direction,
             "type": facility_type,
-            "num_segments": len(group_df),
-            "avg_total_aadt": group_df["TOTAL_AADT"].mean(),
-            "avg_auto_aadt": group_df["AUTO_AADT"].mean(),
-            "avg_truck_aadt": group_df["TRUCK_AADT"].mean(),
-            "avg_truck_pct": group_df["TRUCK_PCT"].mean(),
-            "min_aadt": group_df["TOTAL_AADT"].min(),
-            "max_aadt": group_df["TOTAL_AADT"].max(),
+            "num_segments": int(row["num_segments"]),
+            "avg_total_aadt": row["total_aadt"],
+            "avg_auto_aadt": row["auto_aadt"],
+            "avg_truck_aadt": row["truck_aadt"],
+            "avg_truck_pct": row["truck_pct"],
+            "min_aadt": row["min_aadt"],
+            "max_aadt": row["max_aadt"],
         }
 
         return result
 
+    def _reset_group_caches(self) -> None:
+        """
+        Drop the grouping and cached group-level results.
+
+        The grouping is rebuilt on first use by _aggregate_groups().
+        """
+        self._grp = None
+        self._group_results = None
+        self._summary_df = None
+        self._summary_stats = None
+
+    def _group_by_direction_type(self):
+        """
+        Group segments by direction and facility type.
+        """
+        return self.df.groupby(
+            [config.DIRECTION_FIELD, config.TYPE_FIELD], sort=False, observed=True
+        )
+
+    def _aggregate_groups(self) -> pd.DataFrame:
+        """
+        Aggregate segment AADT by direction and facility type in one groupby pass.
+
+        The result is cached until calculate_segment_aadt() runs again.
+
+        Returns:
+        pd.DataFrame indexed by (direction, type) with the columns of
+        calculate_all_groups()
+        """
+        if self._group_results is None:
+            if self._grp is None:
+                self._grp = self._group_by_direction_type()
+            self._group_results = self._grp.agg(
+                num_segments=("TOTAL_AADT", "size"),
+                total_aadt=("TOTAL_AADT", "mean"),
+                auto_aadt=("AUTO_AADT", "mean"),
+                truck_aadt=("TRUCK_AADT", "mean"),
+                truck_pct=("TRUCK_PCT", "mean"),
+                min_aadt=("TOTAL_AADT", "min"),
+                max_aadt=("TOTAL_AADT", "max"),
+            )
+        return self._group_results
+
     def calculate_all_groups(self) -> pd.DataFrame:
         """
         Calculate average AADT for all direction and facility type combinations.
 
-        This method iterates through all unique combinations of direction and facility type,
-        calculates their average AADT, and returns a DataFrame with all results.
+        All direction and facility type combinations are aggregated in a single
+        groupby pass and returned as one DataFrame. The result is cached until
+        calculate_segment_aadt() runs again; each call returns a copy.
 
         Returns:
         pd.DataFrame: DataFrame with columns:
@@ -129,34 +205,32 @@ class AADTCalculator:
         >>> print(summary.head())
 
         """
-        directions = self.df[config.DIRECTION_FIELD].unique()
-        types = self.df[config.TYPE_FIELD].unique()
-
-        results_list = []
-        for direction in directions:
-            for facility_type in types:
-                result = self.calculate_group_average_aadt(direction, facility_type)
-
-                if result is not None:
-                    results_list.append(result)
-
-        summary_df = pd.DataFrame(results_list)
-
-        col_names = [
-            "direction",
-            "type",
-            "num_segments",
-            "total_aadt",
-            "auto_aadt",
-            "truck_aadt",
-            "truck_pct",
-            "min_aadt",
-            "max_aadt",
-        ]
-
-        summary_df.columns = col_names
-
-        return summary_df
+        if self._summary_df is None:
+            summary_df = self._aggregate_groups().reset_index()
+            summary_df = summary_df.rename(
+                columns={config.DIRECTION_FIELD: "direction", config.TYPE_FIELD: "type"}
+            )
+
+            # Rows by direction, then facility type, each in order of first
+            # appearance in the data; keys as plain strings
+            order = {
+                "direction": self._first_seen_rank(config.DIRECTION_FIELD),
+                "type": self._first_seen_rank(config.TYPE_FIELD),
+            }
+            summary_df = summary_df.astype({"direction": str, "type": str})
+            self._summary_df = summary_df.sort_values(
+                ["direction", "type"],
+                key=lambda keys: keys.map(order[keys.name]).astype(int),
+            ).reset_index(drop=True)
+
+        # Callers get their own copy, so edits cannot corrupt the cache
+        return self._summary_df.copy()
+
+    def _first_seen_rank(self, col: str) -> Dict:
+        """
+        Rank of each value of a column in order of first appearance.
+        """
+        return {value: rank for rank, value in enumerate(self.df[col].unique())}
 
     def get_summary_stats(self) -> Dict:
         """
@@ -175,15 +249,20 @@ class AADTCalculator:
           'facilities': 2
           }
         """
-        summary_df = self.calculate_all_groups()
+        if self._summary_stats is not None:
+            return dict(self._summary_stats)
+
+        group_stats = self._aggregate_groups()
+        group_keys = group_stats.index
 
-        total_segments = summary_df["num_segments"].sum()
-        avg_aadt = summary_df["total_aadt"].mean()
-        min_aadt = summary_df["total_aadt"].min()
-        max_aadt = summary_df["total_aadt"].max()
-        avg_truck_pct = summary_df["truck_pct"].mean()
-        directions = summary_df["direction"].nunique()
-        facilities = summary_df["type"].nunique()
+        total_segments = group_stats["num_segments"].sum()
+        avg_aadt, min_aadt, max_aadt = group_stats["total_aadt"].agg(
+            ["mean", "min", "max"]
+        )
+        avg_truck_pct = group_stats["truck_pct"].mean()
+        # Count observed keys; categories may include values with no segments
+        directions = group_keys.get_level_values(0).nunique()
+        facilities = group_keys.get_level_values(1).nunique()
 
         summary_dict = {
             "total_segments": int(total_segments),
@@ -194,4 +273,5 @@ class AADTCalculator:
             "directions": int(directions),
             "facilities": int(facilities),
         }
-        return summary_dict
+        self._summary_stats = summary_dict
+        return dict(summary_dict)
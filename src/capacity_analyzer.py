@@ -7,22 +7,80 @@ This module calculates capacity, V/C ratios, and Level of Service (LOS) for free
 import pandas as pd
 import numpy as np
 
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import logging
 
 from . import config
 from .utils import (
+    LOS_DTYPE,
     calculate_pce_flow,
     calculate_capacity,
     calculate_vc_ratio,
-    get_los_from_vc,
+    get_los_from_vc_series,
     log_analysis_step,
-    validate_data,
+    validate_values,
 )
 
 logger = logging.getLogger(__name__)
 
 
+def _capacity_columns(period: str) -> Tuple[str, str, str, str]:
+    """
+    Names of the capacity columns for a period.
+
+    Args:
+        period: Time period ('AM' or 'PM')
+
+    Returns:
+        Tuple of (PCE flow, capacity, V/C ratio, LOS) column names
+    """
+    return (
+        f"{period}_PCE_FLOW",
+        f"{period}_CAPACITY",
+        f"{period}_VC_RATIO",
+        f"{period}_LOS",
+    )
+
+
+def _count_los(los: pd.Series) -> Tuple[Dict[str, int], str]:
+    """
+    Count the LOS grades present in a categorical LOS column.
+
+    Args:
+        los: LOS column (categorical, see utils.LOS_DTYPE)
+
+    Returns:
+        Tuple of (counts of the grades that occur, most frequent first;
+        dominant LOS grade). Ties go to the grade that occurs first, and
+        'N/A' is returned when there are no grades.
+    """
+    codes = los.cat.codes.to_numpy()
+    codes = codes[codes >= 0]
+
+    if len(codes) == 0:
+        return {}, "N/A"
+
+    # A single segment is its own dominant grade
+    if len(codes) == 1:
+        grade = los.cat.categories[codes[0]]
+        return {grade: 1}, grade
+
+    # Counts and first occurrence of every grade from the integer codes
+    n_grades = len(los.cat.categories)
+    counts = np.bincount(codes, minlength=n_grades)
+    first_seen = np.full(n_grades, len(codes))
+    np.minimum.at(first_seen, codes, np.arange(len(codes)))
+
+    # Most frequent first, ties broken by first occurrence
+    present = np.flatnonzero(counts)
+    present = present[np.lexsort((first_seen[present], -counts[present]))]
+
+    grades = los.cat.categories
+    los_counts = {grades[i]: int(counts[i]) for i in present}
+
+    return los_counts, grades[present[0]]
+
+
 class CapacityAnalyzer:
     """
     Analyzer for roadway capacity and Level of Service (LOS).
@@ -52,15 +110,46 @@ class CapacityAnalyzer:
                 - Lane count columns (AB_AMLANES, AB_PMLANES)
                 - Direction and facility type columns
 
+        Note:
+            df is copied shallowly; capacity columns are set on the copy, so
+            the caller's frame keeps its columns.
+
         Example:
             >>> df = pd.read_csv('traffic_data.csv')
             >>> analyzer = CapacityAnalyzer(df)
         """
 
-        self.df = df.copy()
+        self.df = df.copy(deep=False)
         self.results = {}
 
-    def calculate_segment_capacity(self, period: str) -> pd.DataFrame:
+        # Low-cardinality keys as categoricals so groupby uses int codes
+        # (no-op when AADTCalculator has already converted them)
+        for col in (config.DIRECTION_FIELD, config.TYPE_FIELD):
+            if col in self.df.columns:
+                self.df[col] = self.df[col].astype("category")
+
+        # Shared grouping and group summaries by period, reset whenever
+        # capacity is recalculated
+        self._grp = None
+        self._group_cache: Dict[str, pd.DataFrame] = {}
+
+        # Periods whose capacity columns exist (passed in or calculated here)
+        self._periods_ready = {
+            period
+            for period in ("AM", "PM")
+            if all(col in self.df.columns for col in _capacity_columns(period))
+        }
+
+        # LOS columns passed in may hold plain strings; the LOS summaries
+        # count grades from the category codes of LOS_DTYPE
+        for period in self._periods_ready:
+            los_col = _capacity_columns(period)[3]
+            if self.df[los_col].dtype != LOS_DTYPE:
+                self.df[los_col] = self.df[los_col].astype(LOS_DTYPE)
+
+    def calculate_segment_capacity(
+        self, period: str, validate: bool = True
+    ) -> pd.DataFrame:
         """
         Calculate capacity metrics for each segment for a specific period.
 
@@ -72,6 +161,8 @@ class CapacityAnalyzer:
 
         Args:
             period: Time period ('AM' or 'PM')
+            validate: Check the V/C ratios against config.VALIDATION_RANGES
+                (default True); batch runs can pass False to skip the scan
 
         Returns:
             pd.DataFrame: DataFrame with original data plus new capacity columns:
@@ -92,64 +183,133 @@ class CapacityAnalyzer:
         if period not in ["AM", "PM"]:
             raise ValueError(f"Invalid period: {period}. Must be 'AM' or 'PM'.")
 
-        peak_total_col = f"{period}_PEAK_TOTAL"
-        peak_truck_col = f"{period}_PEAK_TRUCK"
+        self._add_capacity_columns([period], validate=validate)
 
-        if (
-            peak_total_col not in self.df.columns
-            or peak_truck_col not in self.df.columns
-        ):
-            raise ValueError(f"{peak_total_col} or {peak_truck_col} is missing.")
+        return self.df
+
+    def _add_capacity_columns(self, periods: List[str], validate: bool = True) -> None:
+        """
+        Add PCE flow, capacity, V/C ratio and LOS columns for several periods.
+
+        The flow and lane columns of all periods are read as 2D arrays (one
+        column per period), so every formula runs once for all periods.
+
+        Args:
+            periods: Time periods to calculate ('AM' and/or 'PM')
+            validate: Check the V/C ratios against config.VALIDATION_RANGES
+        """
+        peak_total_cols = [f"{period}_PEAK_TOTAL" for period in periods]
+        peak_truck_cols = [f"{period}_PEAK_TRUCK" for period in periods]
+
+        for peak_total_col, peak_truck_col in zip(peak_total_cols, peak_truck_cols):
+            if (
+                peak_total_col not in self.df.columns
+                or peak_truck_col not in self.df.columns
+            ):
+                raise ValueError(f"{peak_total_col} or {peak_truck_col} is missing.")
+
+        # lane number
+        lane_cols = [config.LANE_FIELDS[period] for period in periods]
+
+        for period_lane in lane_cols:
+            if period_lane not in self.df.columns:
+                raise ValueError(f"Lane column '{period_lane}' not found in DataFrame.")
 
         log_analysis_step(
             step_name="Capacity Analyzer",
-            message=f"Starting {period} capacity segment calculation",
+            message=f"Starting {'/'.join(periods)} capacity segment calculation",
         )
 
-        period_peak_total = self.df[peak_total_col]
-        period_peak_truck = self.df[peak_truck_col]
-
         # PCE flow
-        self.df[f"{period}_PCE_FLOW"] = calculate_pce_flow(
-            total_flow=period_peak_total, truck_flow=period_peak_truck
+        pce_flow = calculate_pce_flow(
+            total_flow=self.df[peak_total_cols].to_numpy(),
+            truck_flow=self.df[peak_truck_cols].to_numpy(),
         )
 
-        # lane number
-        period_lane = config.LANE_FIELDS[period]
-
-        if period_lane not in self.df.columns:
-            raise ValueError(f"Lane column '{period_lane}' not found in DataFrame.")
-
         # calculate lane capacity
-        self.df[f"{period}_CAPACITY"] = calculate_capacity(self.df[period_lane])
+        capacity = calculate_capacity(self.df[lane_cols].to_numpy())
+
+        # V/C ratio, NaN where there is no capacity
+        vc_ratio = calculate_vc_ratio(pce_flow, capacity)
+
+        # Store flows and ratios as float32 (and capacity as int32 when the
+        # lane counts are integers), halving the bytes every reduction reads
+        if np.issubdtype(capacity.dtype, np.integer):
+            capacity = capacity.astype(np.int32)
+
+        new_columns = {}
+        for i, period in enumerate(periods):
+            pce_col, cap_col, vc_col, los_col = _capacity_columns(period)
+            new_columns[pce_col] = pce_flow[:, i].astype(np.float32)
+            new_columns[cap_col] = capacity[:, i]
+            new_columns[vc_col] = vc_ratio[:, i].astype(np.float32)
+
+            # determine los from the full-precision ratios, so values right at
+            # a threshold are graded before rounding to float32
+            new_columns[los_col] = get_los_from_vc_series(
+                pd.Series(vc_ratio[:, i], index=self.df.index)
+            )
 
-        self.df[f"{period}_VC_RATIO"] = calculate_vc_ratio(
-            pce_flow=self.df[f"{period}_PCE_FLOW"],
-            capacity=self.df[f"{period}_CAPACITY"],
-        )
+            # validate vc ratio on the computed array, before it is stored
+            if validate:
+                is_valid, errors = validate_values(vc_ratio[:, i], vc_col, "vc_ratio")
 
-        # determine los
-        self.df[f"{period}_LOS"] = self.df[f"{period}_VC_RATIO"].apply(get_los_from_vc)
+                if not is_valid:
+                    logger.warning(f"{period} V/C ratio error: {errors}")
 
-        # validate vc ratio
-        is_valid, errors = validate_data(self.df, f"{period}_VC_RATIO", "vc_ratio")
+        # Set the columns of all periods; assign() would copy the whole frame
+        for col, values in new_columns.items():
+            self.df[col] = values
 
-        if not is_valid:
-            logger.warning(f"{period} V/C ratio error: {errors}")
+        # New capacity columns invalidate the grouping and group summaries
+        self._grp = None
+        self._group_cache.clear()
+        self._periods_ready.update(periods)
 
         log_analysis_step(
             "Capacity Analyzer", f"Analyzed Capacity for {len(self.df)} segments."
         )
 
-        return self.df
+    def _check_period_ready(self, period: str) -> None:
+        """
+        Raise ValueError unless the capacity columns of a period exist.
+
+        A set lookup instead of scanning the DataFrame columns on every call.
+
+        Args:
+            period: Time period ('AM' or 'PM')
+        """
+        if period not in self._periods_ready:
+            raise ValueError(
+                f"Missing columns: {list(_capacity_columns(period))}. "
+                f"Run calculate_segment_capacity() first."
+            )
 
-    def calculate_all_periods_capacity(self) -> pd.DataFrame:
+    def _group_by_direction_type(self):
+        """
+        Group segments by direction and facility type.
+
+        The grouping is built once and shared by the group-level methods of
+        both periods, so the keys are hashed once. It is rebuilt after
+        capacity columns are added.
+        """
+        if self._grp is None:
+            self._grp = self.df.groupby(
+                [config.DIRECTION_FIELD, config.TYPE_FIELD], observed=True
+            )
+        return self._grp
+
+    def calculate_all_periods_capacity(self, validate: bool = True) -> pd.DataFrame:
         """
         Calculate capacity metrics for both AM and PM periods.
 
 
-        This is a convenience method that calls calculate_segment_capacity()
-        for both AM and PM periods.
+        Both periods are calculated together in one vectorized pass, giving the
+        same columns as calling calculate_segment_capacity() for AM and PM.
+
+        Args:
+            validate: Check the V/C ratios against config.VALIDATION_RANGES
+                (default True)
 
         Returns:
             pd.DataFrame: DataFrame with capacity metrics for both periods
@@ -159,14 +319,9 @@ class CapacityAnalyzer:
             >>> result_df = analyzer.calculate_all_periods_capacity()
             >>> print(result_df[['AM_LOS', 'PM_LOS']].head())
 
-        Steps to implement:
-            1. Call calculate_segment_capacity('AM')
-            2. Call calculate_segment_capacity('PM')
-            3. Return self.df
         """
 
-        self.df = self.calculate_segment_capacity(period="AM")
-        self.df = self.calculate_segment_capacity(period="PM")
+        self._add_capacity_columns(["AM", "PM"], validate=validate)
 
         return self.df
 
@@ -180,6 +335,9 @@ class CapacityAnalyzer:
         has been run for the requested period. If you want to analyze both AM and PM,
         run calculate_all_periods_capacity() first.
 
+        Kept for API compatibility: the statistics are looked up in the cached
+        summary of calculate_all_groups_capacity().
+
         Args:
             direction: Direction code ('N', 'S', 'E', 'W')
             facility_type: Facility type ('ML' for Main Lanes, 'HV' for HOV Lanes)
@@ -215,43 +373,33 @@ class CapacityAnalyzer:
         if period not in ["AM", "PM"]:
             raise ValueError(f"Period {period} wrong. Should be 'AM' or 'PM'.")
 
-        required_cols = [
-            f"{period}_PCE_FLOW",
-            f"{period}_CAPACITY",
-            f"{period}_VC_RATIO",
-            f"{period}_LOS",
-        ]
-        missing_cols = [col for col in required_cols if col not in self.df.columns]
-        if missing_cols:
-            raise ValueError(
-                f"Missing columns: {missing_cols}. Run calculate_segment_capacity() first."
-            )
-
-        mask = (self.df[config.DIRECTION_FIELD] == direction) & (
-            self.df[config.TYPE_FIELD] == facility_type
-        )
+        self._check_period_ready(period)
 
-        group_df = self.df[mask]
+        summary_df = self.calculate_all_groups_capacity(period)
+        group_summary = summary_df[
+            (summary_df["direction"] == direction)
+            & (summary_df["type"] == facility_type)
+        ]
 
-        if len(group_df) == 0:
+        if group_summary.empty:
             logger.warning(
                 f"No data found for direction '{direction}' and facility type '{facility_type}'"
             )
             return None
 
-        los_counts = group_df[f"{period}_LOS"].value_counts()
+        row = group_summary.iloc[0]
         result = {
             "direction": direction,
             "type": facility_type,
             "period": period,
-            "num_segments": len(group_df),
-            "avg_pce_flow": float(group_df[f"{period}_PCE_FLOW"].mean()),
-            "avg_capacity": float(group_df[f"{period}_CAPACITY"].mean()),
-            "avg_vc_ratio": float(group_df[f"{period}_VC_RATIO"].mean()),
-            "min_vc_ratio": float(group_df[f"{period}_VC_RATIO"].min()),
-            "max_vc_ratio": float(group_df[f"{period}_VC_RATIO"].max()),
-            "dominant_los": los_counts.idxmax() if len(los_counts) > 0 else "N/A",
-            "los_counts": group_df[f"{period}_LOS"].value_counts().to_dict(),
+            "num_segments": int(row["num_segments"]),
+            "avg_pce_flow": float(row["avg_pce_flow"]),
+            "avg_capacity": float(row["avg_capacity"]),
+            "avg_vc_ratio": float(row["avg_vc_ratio"]),
+            "min_vc_ratio": float(row["min_vc_ratio"]),
+            "max_vc_ratio": float(row["max_vc_ratio"]),
+            "dominant_los": row["dominant_los"],
+            "los_counts": dict(row["los_counts"]),
         }
 
         return result
@@ -276,6 +424,7 @@ class CapacityAnalyzer:
                 - min_vc_ratio: Minimum V/C ratio in group
                 - max_vc_ratio: Maximum V/C ratio in group
                 - dominant_los: Most frequent LOS grade in group
+                - los_counts: Count of each LOS grade in group
 
         Example:
             >>> analyzer = CapacityAnalyzer(df)
@@ -284,55 +433,76 @@ class CapacityAnalyzer:
             >>> pm_summary = analyzer.calculate_all_groups_capacity('PM')
             >>> print(am_summary)
 
-        Steps to implement:
-            1. Validate period parameter
-            2. Check if capacity columns exist
-            3. Log the start of calculation
-            4. Get unique values for directions and facility types
-            5. Loop through all combinations
-            6. Call calculate_group_capacity() for each combination
-            7. Collect non-None results in a list
-            8. Convert list to DataFrame
-            9. Sort by direction and type
-            10. Log completion
-            11. Return DataFrame
+        All groups are aggregated in a single groupby pass, with the same
+        statistics as calculate_group_capacity() for each combination. The
+        result is cached per period until capacity is recalculated; each call
+        returns a copy.
         """
-        # TODO: Implement this method
-        # Hint: Very similar to calculate_all_groups_peak() from Phase 2
 
         if period not in ["AM", "PM"]:
             raise ValueError("period should only be 'AM' or 'PM.")
 
-        if f"{period}_CAPACITY" not in self.df.columns:
-            raise ValueError(f"{period}_CAPACITY column should be in the DataFrame")
-
-        log_analysis_step("Capacity Analyzer", f"Analyzing {period} Group Capacity.")
+        self._check_period_ready(period)
 
-        directions = self.df[config.DIRECTION_FIELD].unique()
-        facility_types = self.df[config.TYPE_FIELD].unique()
+        if period in self._group_cache:
+            return self._copy_group_summary(self._group_cache[period])
 
-        result_list = []
-        for direction in directions:
-            for facility_type in facility_types:
-                result = self.calculate_group_capacity(
-                    direction=direction, facility_type=facility_type, period=period
-                )
+        log_analysis_step("Capacity Analyzer", f"Analyzing {period} Group Capacity.")
 
-                if result is not None:
-                    result_list.append(result)
+        pce_col, cap_col, vc_col, los_col = _capacity_columns(period)
+
+        # One groupby pass over all direction and facility type combinations
+        grouped = self._group_by_direction_type()
+        summary_df = grouped.agg(
+            num_segments=(vc_col, "size"),
+            avg_pce_flow=(pce_col, "mean"),
+            avg_capacity=(cap_col, "mean"),
+            avg_vc_ratio=(vc_col, "mean"),
+            min_vc_ratio=(vc_col, "min"),
+            max_vc_ratio=(vc_col, "max"),
+        )
 
-        summary_df = pd.DataFrame(result_list)
+        los_summary = grouped[los_col].apply(_count_los)
+        summary_df["dominant_los"] = los_summary.map(lambda counts: counts[1])
+        summary_df["los_counts"] = los_summary.map(lambda counts: counts[0])
+        summary_df.insert(0, "period", period)
 
-        summary_df = summary_df.sort_values(["direction", "type"]).reset_index(
-            drop=True
+        summary_df = summary_df.reset_index().rename(
+            columns={config.DIRECTION_FIELD: "direction", config.TYPE_FIELD: "type"}
         )
+        summary_df = summary_df[
+            [
+                "direction",
+                "type",
+                "period",
+                "num_segments",
+                "avg_pce_flow",
+                "avg_capacity",
+                "avg_vc_ratio",
+                "min_vc_ratio",
+                "max_vc_ratio",
+                "dominant_los",
+                "los_counts",
+            ]
+        ]
 
         log_analysis_step(
             "Capacity Analyzer",
             f"Completed {period} group capacity analysis for {len(summary_df)} groups.",
         )
 
-        return summary_df
+        self._group_cache[period] = summary_df
+        return self._copy_group_summary(summary_df)
+
+    @staticmethod
+    def _copy_group_summary(summary_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Copy a cached group summary, including its los_counts dicts, so
+        callers cannot change the cache by editing the result.
+        """
+        summary_copy = summary_df.copy()
+        summary_copy["los_counts"] = summary_copy["los_counts"].map(dict)
+        return summary_copy
 
     def get_los_distribution(self, period: str) -> Dict:
         """
@@ -381,38 +551,47 @@ class CapacityAnalyzer:
         if period not in ["AM", "PM"]:
             raise ValueError(f"Invalid period: {period}. Must be 'AM' or 'PM'")
 
-        if f"{period}_LOS" not in self.df.columns:
-            raise ValueError(f"{period}_LOS column is missing.")
+        _, _, vc_col, los_col = _capacity_columns(period)
+
+        if los_col not in self.df.columns:
+            raise ValueError(f"{los_col} column is missing.")
 
         log_analysis_step(
             "Capacity Analyzer", f"Getting LOS distributions for {period}."
         )
-        period_LOS = self.df[f"{period}_LOS"]
-        period_vc_ratio = self.df[f"{period}_VC_RATIO"]
+        period_LOS = self.df[los_col]
+        period_vc_ratio = self.df[vc_col]
 
         # Get LOS counts and calculate percentages safely
-        los_counts = period_LOS.value_counts()
+        los_counts, _ = _count_los(period_LOS)
         total_segments = len(period_LOS)
 
-        # Calculate percentages for each LOS, handling missing grades
-        los_percentages = {}
-        for los_grade in ["A", "B", "C", "D", "E", "F"]:
-            count = los_counts.get(los_grade, 0)
-            los_percentages[los_grade] = (
-                (count / total_segments) * 100 if total_segments > 0 else 0.0
-            )
+        # Calculate percentages for each LOS in one array operation,
+        # with 0 for missing grades
+        los_grades = list(config.LOS_THRESHOLDS)
+        grade_counts = np.array([los_counts.get(grade, 0) for grade in los_grades])
+        if total_segments > 0:
+            grade_percentages = (grade_counts / total_segments) * 100
+        else:
+            grade_percentages = np.zeros(len(los_grades))
+        los_percentages = dict(zip(los_grades, grade_percentages.tolist()))
+
+        # Over capacity comes from the V/C ratios themselves, not the LOS
+        # labels, which may be precomputed or stale
+        segments_over_capacity = int((period_vc_ratio.to_numpy() > 1.0).sum())
 
         result_dict = {
             "period": period,
             "total_segments": total_segments,
-            "los_counts": los_counts.to_dict(),
+            "los_counts": los_counts,
             "los_percentages": los_percentages,
             "avg_vc_ratio": float(period_vc_ratio.mean()),
-            "segments_over_capacity": int((period_vc_ratio > 1).sum()),
+            "segments_over_capacity": segments_over_capacity,
             "percentage_over_capacity": (
-                (period_vc_ratio > 1).sum() / len(period_vc_ratio)
-            )
-            * 100,
+                (segments_over_capacity / total_segments) * 100
+                if total_segments > 0
+                else 0.0
+            ),
         }
 
         return result_dict
@@ -468,17 +647,15 @@ class CapacityAnalyzer:
 
         summary_df = am_cols.merge(pm_cols, on=["direction", "type"])
 
-        summary_df["vc_diff"] = (
-            summary_df["am_vc_ratio"] - summary_df["pm_vc_ratio"]
-        ).abs()
-
-        summary_df["worse_period"] = np.where(
-            summary_df["am_vc_ratio"] > summary_df["pm_vc_ratio"],
-            "AM",
-            np.where(
-                summary_df["pm_vc_ratio"] > summary_df["am_vc_ratio"], "PM", "EQUAL"
-            ),
+        diff = (
+            summary_df["am_vc_ratio"].to_numpy() - summary_df["pm_vc_ratio"].to_numpy()
         )
+        summary_df["vc_diff"] = np.abs(diff)
+
+        # Sign of the difference (-1, 0, 1) picks PM, EQUAL or AM in one gather;
+        # a missing ratio counts as EQUAL
+        sign = np.sign(np.nan_to_num(diff, nan=0.0)).astype(np.int8)
+        summary_df["worse_period"] = np.array(["PM", "EQUAL", "AM"])[sign + 1]
 
         log_analysis_step("Capacity Analyzer", "Complete comparing am and pm capacity")
 
@@ -532,23 +709,34 @@ class CapacityAnalyzer:
         if (vc_threshold < 0) or (vc_threshold > 3):
             raise ValueError(f"vc_threshold should be between 0 and 3.0.")
 
-        if f"{period}_VC_RATIO" not in self.df.columns:
-            raise ValueError(f"{period}_VC_RATIO column should exists in the table")
+        pce_col, cap_col, vc_col, los_col = _capacity_columns(period)
+
+        if vc_col not in self.df.columns:
+            raise ValueError(f"{vc_col} column should exists in the table")
 
         log_analysis_step("Capacity Analyzer", "Start identifying bottlenecks")
 
-        result_df = self.df[(self.df[f"{period}_VC_RATIO"] > vc_threshold)]
-        result_df = result_df[
+        # Select the report columns first so only they are filtered and sorted
+        result_df = self.df[
             [
-                "direction",
-                "type",
-                f"{period}_VC_RATIO",
-                f"{period}_LOS",
-                f"{period}_PCE_FLOW",
-                f"{period}_CAPACITY",
+                config.DIRECTION_FIELD,
+                config.TYPE_FIELD,
+                vc_col,
+                los_col,
+                pce_col,
+                cap_col,
             ]
-        ]
-        result_df = result_df.sort_values(f"{period}_VC_RATIO", ascending=False)
+        ].rename(
+            columns={config.DIRECTION_FIELD: "direction", config.TYPE_FIELD: "type"}
+        )
+
+        vc_ratio = result_df[vc_col].to_numpy()
+        bottleneck_rows = np.flatnonzero(vc_ratio > vc_threshold)
+
+        # Highest V/C ratio first; equal ratios keep segment order
+        order = np.argsort(-vc_ratio[bottleneck_rows], kind="stable")
+        result_df = result_df.take(bottleneck_rows[order])
+
         log_analysis_step(
             "Capacity Analyzer",
             f"Completed identifying bottlenecks, there are {len(result_df)} segments identified as bottlenecks.",
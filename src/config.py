@@ -131,6 +131,14 @@ PERIOD_FIELDS = {
     "NT": NT_FIELDS,
 }
 
+# Auto and truck flow fields across all periods (used for daily totals)
+AUTO_FLOW_FIELDS = [
+    field for fields in PERIOD_FIELDS.values() for field in fields["auto"]
+]
+TRUCK_FLOW_FIELDS = [
+    field for fields in PERIOD_FIELDS.values() for field in fields["truck"]
+]
+
 # Lane number fields for different periods
 
 LANE_FIELDS = {
@@ -163,6 +171,23 @@ DIRECTION_FIELD = "DIRECT"
 TYPE_FIELD = "TYPE"
 FACILITY_FIELD = TYPE_FIELD  # Alias for backward compatibility
 
+# Fields every input file must provide
+REQUIRED_FIELDS = [DIRECTION_FIELD, TYPE_FIELD, "ID", "LENGTH"]
+
+# Columns read from the input files; the other ABM attributes are not used
+LOAD_FIELDS = (
+    REQUIRED_FIELDS + list(LANE_FIELDS.values()) + AUTO_FLOW_FIELDS + TRUCK_FLOW_FIELDS
+)
+
+# Column dtypes applied while parsing the input files (categorical keys let
+# filters and groupby compare integer codes instead of strings). Integer
+# fields such as ID are left to the range-checked downcast after loading.
+LOAD_DTYPES = {
+    "LENGTH": "float32",
+    DIRECTION_FIELD: "category",
+    TYPE_FIELD: "category",
+}
+
 # ============================================================================
 # SECTION DEFINITIONS
 # ============================================================================
@@ -200,6 +225,9 @@ OUTPUT_DIR = "data/output"
 INPUT_FILE_PATTERN = "i5-cmcp-{year}-sec{section}.csv"
 OUTPUT_FILE_DEFAULT = "I5_Analysis_Output.xlsx"
 
+# Maximum number of input files read concurrently by DataLoader
+LOAD_MAX_WORKERS = 6
+
 # ============================================================================
 # ANALYSIS YEARS
 # ============================================================================
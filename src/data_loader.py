@@ -5,8 +5,10 @@ This module handles loading and preprocessing of SCAG ABM data.
 """
 
 import pandas as pd
+import numpy as np
 import os
-from typing import Optional, List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Tuple
 import logging
 
 from . import config
@@ -14,21 +16,30 @@ from .utils import log_analysis_step, validate_data, create_summary_stats
 
 logger = logging.getLogger(__name__)
 
+# AM / PM flow fields, of which each input file needs at least one per period
+_AM_FLOW_FIELDS = frozenset(config.AM_FIELDS["auto"] + config.AM_FIELDS["truck"])
+_PM_FLOW_FIELDS = frozenset(config.PM_FIELDS["auto"] + config.PM_FIELDS["truck"])
+
 
 class DataLoader:
     """
     Class for loading and preprocessing SCAG ABM traffic data.
     """
 
-    def __init__(self, data_dir: str = None):
+    def __init__(self, data_dir: str = None, all_columns: bool = True):
         """
         Initialize DataLoader.
 
         Args:
             data_dir: Path to data directory
                      If None, uses config.INPUT_DIR
+            all_columns: If True (default), keep every column of the input
+                     files; pass False to parse only config.LOAD_FIELDS,
+                     which is faster and uses less memory
         """
         self.data_dir = data_dir or config.INPUT_DIR
+        self.all_columns = all_columns
+        self._section_cache: Dict[Tuple[int, int], pd.DataFrame] = {}
         log_analysis_step("DataLoader", f"Initialized with data_dir: {self.data_dir}")
 
     def load_section_data(self, year: int, section: int) -> pd.DataFrame:
@@ -39,22 +50,84 @@ class DataLoader:
             year: Analysis year (2019 or 2045)
             section: Section number
 
+        Returns:
+            DataFrame containing section data (DataFrame)
+
+        Note:
+            Each file is parsed once per loader; later calls return a shallow
+            copy of the cached frame. Adding or replacing columns
+            (df[col] = ...) leaves the cache unchanged; copy the frame before
+            editing values in place.
+            Call clear_cache() to re-read files that changed on disk.
+        """
+        return self._load_cached_section(year, section)
+
+    def clear_cache(self) -> None:
+        """
+        Drop cached section data so the next load re-reads the CSV files.
+        """
+        self._section_cache.clear()
+
+    def _load_cached_section(
+        self, year: int, section: int, filepath: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Return a shallow copy of the cached section, reading it on first use.
+
+        Args:
+            year: Analysis year (2019 or 2045)
+            section: Section number
+            filepath: Path of the section file, if already resolved
+
+        Returns:
+            DataFrame containing section data (DataFrame)
+        """
+        key = (year, section)
+        if key not in self._section_cache:
+            self._section_cache[key] = self._read_section_data(year, section, filepath)
+        else:
+            log_analysis_step(
+                "DataLoader", f"Using cached data for {year} section {section}"
+            )
+
+        return self._section_cache[key].copy(deep=False)
+
+    def _read_section_data(
+        self, year: int, section: int, filepath: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Read and validate one section file from disk.
+
+        Args:
+            year: Analysis year (2019 or 2045)
+            section: Section number
+            filepath: Path of the section file, already known to exist
+                (e.g. from a directory scan); if None it is built from
+                config.INPUT_FILE_PATTERN and checked
+
         Returns:
             DataFrame containing section data (DataFrame)
         """
         # Construct filename
         filename = config.INPUT_FILE_PATTERN.format(year=year, section=section)
-        filepath = os.path.join(self.data_dir, filename)
+        if filepath is None:
+            filepath = os.path.join(self.data_dir, filename)
 
-        log_analysis_step("DataLoader", f"Loading data from: {filepath}")
+            # Check if file exists
+            if not os.path.exists(filepath):
+                raise FileNotFoundError(f"Data file not found: {filepath}")
 
-        # Check if file exists
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(f"Data file not found: {filepath}")
+        log_analysis_step("DataLoader", f"Loading data from: {filepath}")
 
         try:
-            # Load CSV file
-            df = pd.read_csv(filepath, encoding="utf-8-sig")
+            # Load CSV file, parsing only the fields the analysis uses
+            load_fields = set(config.LOAD_FIELDS)
+            df = pd.read_csv(
+                filepath,
+                usecols=None if self.all_columns else load_fields.__contains__,
+                dtype=config.LOAD_DTYPES,
+                encoding="utf-8-sig",
+            )
 
             log_analysis_step(
                 "DataLoader", f"Successfully loaded {len(df)} segments from {filename}"
@@ -67,7 +140,7 @@ class DataLoader:
             df["YEAR"] = year
             df["SECTION"] = section
 
-            return df
+            return self._downcast_numeric_fields(df)
 
         except Exception as e:
             logger.error(f"Error loading data from {filepath}: {str(e)}")
@@ -77,6 +150,7 @@ class DataLoader:
         """
         Load data for all sections of a specific year.
 
+        Sections are read concurrently (see _load_sections()).
 
         Args:
             year: Analysis year
@@ -87,32 +161,55 @@ class DataLoader:
         """
         log_analysis_step("DataLoader", f"Loading all sections for year {year}")
 
-        sections_data = {}
-        for section in [1, 2, 3]:
-            try:
-                df = self.load_section_data(year, section)
-                sections_data[section] = df
-                log_analysis_step(
-                    "DataLoader", f"Loaded section {section}: {len(df)} segments"
-                )
-            except FileNotFoundError:
-                logger.warning(f"Section {section} data not found for year {year}")
-                continue
+        loaded = self._load_sections([(year, section) for section in [1, 2, 3]])
+        return {section: df for (_, section), df in loaded.items()}
+
+    def load_all_sections_concat(self, year: int) -> pd.DataFrame:
+        """
+        Load all sections of a specific year into a single DataFrame.
 
-        return sections_data
+        Useful when an analysis runs over every section at once: one
+        long-form frame is filtered or grouped in a single pass instead of
+        once per section.
+
+        Args:
+            year: Analysis year
+
+        Returns:
+            DataFrame with the rows of all available sections; the SECTION
+            column identifies each row's section (empty if none were found)
+        """
+        sections_data = self.load_all_sections(year)
+        if not sections_data:
+            return pd.DataFrame()
+
+        df = pd.concat(list(sections_data.values()), ignore_index=True)
+
+        # concat falls back to object dtype when the sections' categories differ
+        for field in (config.DIRECTION_FIELD, config.FACILITY_FIELD):
+            if not isinstance(df[field].dtype, pd.CategoricalDtype):
+                df[field] = df[field].astype("category")
+
+        return df
 
     def load_all_data(self) -> Dict[int, Dict[int, pd.DataFrame]]:
         """
         Load all available data (all years and sections).
 
+        All (year, section) files are read concurrently (see _load_sections()).
+
         Returns:
             Nested dictionary: {year: {section: DataFrame}}
         """
         log_analysis_step("DataLoader", "Loading all available data")
 
-        all_data = {}
-        for year in config.ANALYSIS_YEARS:
-            all_data[year] = self.load_all_sections(year)
+        loaded = self._load_sections(
+            [(year, section) for year in config.ANALYSIS_YEARS for section in [1, 2, 3]]
+        )
+
+        all_data = {year: {} for year in config.ANALYSIS_YEARS}
+        for (year, section), df in loaded.items():
+            all_data[year][section] = df
 
         # Log summary
         total_sections = sum(len(sections) for sections in all_data.values())
@@ -123,6 +220,49 @@ class DataLoader:
 
         return all_data
 
+    def _load_sections(
+        self, keys: List[Tuple[int, int]]
+    ) -> Dict[Tuple[int, int], pd.DataFrame]:
+        """
+        Load several (year, section) files in a thread pool.
+
+        The files are independent and read_csv releases the GIL while parsing,
+        so reads overlap. The data directory is scanned once up front, so
+        missing files are skipped with a warning without a stat call each.
+
+        Args:
+            keys: (year, section) pairs to load
+
+        Returns:
+            Dictionary mapping (year, section) to DataFrame, in the order of keys
+        """
+        try:
+            with os.scandir(self.data_dir) as it:
+                files = {entry.name: entry.path for entry in it if entry.is_file()}
+        except FileNotFoundError:
+            files = {}
+
+        loaded = {}
+        with ThreadPoolExecutor(max_workers=config.LOAD_MAX_WORKERS) as executor:
+            futures = {}
+            for year, section in keys:
+                filename = config.INPUT_FILE_PATTERN.format(year=year, section=section)
+                if filename not in files and (year, section) not in self._section_cache:
+                    logger.warning(f"Section {section} data not found for year {year}")
+                    continue
+                futures[(year, section)] = executor.submit(
+                    self._load_cached_section, year, section, files.get(filename)
+                )
+
+            for (year, section), future in futures.items():
+                df = future.result()
+                loaded[(year, section)] = df
+                log_analysis_step(
+                    "DataLoader", f"Loaded section {section}: {len(df)} segments"
+                )
+
+        return loaded
+
     def _validate_required_fields(self, df: pd.DataFrame):
         """
         Validate that DataFrame contains required fields.
@@ -134,41 +274,71 @@ class DataLoader:
         Raises:
             ValueError: If required fields are missing
         """
-        required_fields = [
-            config.DIRECTION_FIELD,
-            config.FACILITY_FIELD,
-            "ID",
-            "LENGTH",
-        ]
+        columns = set(df.columns)
 
         # Check for required fields
-        missing_fields = [field for field in required_fields if field not in df.columns]
+        missing_fields = [
+            field for field in config.REQUIRED_FIELDS if field not in columns
+        ]
 
         if missing_fields:
             raise ValueError(f"Missing required fields: {missing_fields}")
 
         # Check for flow fields (at least AM and PM should exist)
-        am_fields_exist = any(
-            field in df.columns
-            for field in config.AM_FIELDS["auto"] + config.AM_FIELDS["truck"]
-        )
-        pm_fields_exist = any(
-            field in df.columns
-            for field in config.PM_FIELDS["auto"] + config.PM_FIELDS["truck"]
-        )
+        am_fields_exist = not _AM_FLOW_FIELDS.isdisjoint(columns)
+        pm_fields_exist = not _PM_FLOW_FIELDS.isdisjoint(columns)
 
         if not (am_fields_exist and pm_fields_exist):
             raise ValueError("Missing required flow fields (AM or PM period data)")
 
         log_analysis_step("DataLoader", "Data validation passed")
 
-    def filter_by_direction(self, df: pd.DataFrame, direction: str) -> pd.DataFrame:
+    def _downcast_numeric_fields(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store 64-bit integer analysis fields as int32 where the values fit.
+
+        SCAG volumes, IDs and lane counts are far below 2**31. Integer columns
+        go to int32 rather than the smallest fitting type so that arithmetic
+        such as lanes * CAPACITY_PER_LANE cannot overflow. Float fields keep
+        float64: the flow columns are summed into AADT and peak totals, which
+        must match full-precision results.
+
+        Args:
+            df: Freshly loaded DataFrame
+
+        Returns:
+            DataFrame with downcast numeric columns
+        """
+        # Only analysis fields; raw attributes kept by all_columns are untouched
+        fields = df[df.columns.intersection(config.LOAD_FIELDS)]
+
+        int32_info = np.iinfo(np.int32)
+        downcast = {}
+        for col in fields.select_dtypes(include="int64").columns:
+            values = df[col].to_numpy()
+            if len(values) == 0 or (
+                values.min() >= int32_info.min and values.max() <= int32_info.max
+            ):
+                downcast[col] = np.int32
+
+        if not downcast:
+            return df
+
+        # astype() with a dict rebuilds the frame with one block per column;
+        # copy() consolidates it so later column inserts stay cheap
+        return df.astype(downcast).copy()
+
+    def filter_by_direction(
+        self, df: pd.DataFrame, direction: str, copy: bool = False
+    ) -> pd.DataFrame:
         """
         Filter data by direction.
 
         Args:
             df: DataFrame to filter
             direction: Direction code ('N' or 'S')
+            copy: If True, return an explicit copy of the selected rows; pass
+                it when the result will be modified in place
 
         Returns:
             Filtered DataFrame
@@ -176,25 +346,33 @@ class DataLoader:
         if direction not in ["N", "S"]:
             raise ValueError("Direction must be 'N' or 'S'")
 
-        filtered = df[df[config.DIRECTION_FIELD] == direction].copy()
+        filtered = df[df[config.DIRECTION_FIELD] == direction]
+        if copy:
+            filtered = filtered.copy()
         log_analysis_step(
             "DataLoader", f"Filtered by direction {direction}: {len(filtered)} segments"
         )
 
         return filtered
 
-    def filter_by_facility(self, df: pd.DataFrame, facility: str) -> pd.DataFrame:
+    def filter_by_facility(
+        self, df: pd.DataFrame, facility: str, copy: bool = False
+    ) -> pd.DataFrame:
         """
         Filter data by facility type.
 
         Args:
             df: DataFrame to filter
             facility: Facility code
+            copy: If True, return an explicit copy of the selected rows; pass
+                it when the result will be modified in place
 
         Returns:
             Filtered DataFrame
         """
-        filtered = df[df[config.FACILITY_FIELD] == facility].copy()
+        filtered = df[df[config.FACILITY_FIELD] == facility]
+        if copy:
+            filtered = filtered.copy()
         log_analysis_step(
             "DataLoader", f"Filtered by facility {facility}: {len(filtered)} segments"
         )
@@ -215,19 +393,16 @@ class DataLoader:
         """
         groups = {}
 
-        for direction in df[config.DIRECTION_FIELD].unique():
-            for facility in df[config.FACILITY_FIELD].unique():
-                mask = (df[config.DIRECTION_FIELD] == direction) & (
-                    df[config.FACILITY_FIELD] == facility
-                )
-                group_df = df[mask].copy()
-
-                if len(group_df) > 0:
-                    groups[(direction, facility)] = group_df
-                    log_analysis_step(
-                        "DataLoader",
-                        f"Group ({direction}, {facility}): {len(group_df)} segments",
-                    )
+        # One groupby pass instead of a boolean mask per (direction, facility)
+        grouped = df.groupby(
+            [config.DIRECTION_FIELD, config.FACILITY_FIELD], sort=False, observed=True
+        )
+        for (direction, facility), group_df in grouped:
+            groups[(direction, facility)] = group_df
+            log_analysis_step(
+                "DataLoader",
+                f"Group ({direction}, {facility}): {len(group_df)} segments",
+            )
 
         return groups
 
@@ -251,11 +426,26 @@ class DataLoader:
 
         # Count segments by direction and facility
         if config.DIRECTION_FIELD in df.columns and config.FACILITY_FIELD in df.columns:
-            summary["segments_by_group"] = (
-                df.groupby([config.DIRECTION_FIELD, config.FACILITY_FIELD])
-                .size()
-                .to_dict()
+            # One bincount over combined category codes instead of a groupby
+            directions = df[config.DIRECTION_FIELD].astype("category").cat
+            facilities = df[config.FACILITY_FIELD].astype("category").cat
+            dir_codes = directions.codes.to_numpy()
+            fac_codes = facilities.codes.to_numpy()
+            valid = (dir_codes >= 0) & (fac_codes >= 0)  # -1 marks missing keys
+
+            num_facilities = len(facilities.categories)
+            counts = np.bincount(
+                dir_codes[valid].astype(np.int64) * num_facilities + fac_codes[valid],
+                minlength=len(directions.categories) * num_facilities,
             )
+            summary["segments_by_group"] = {
+                (
+                    directions.categories[key // num_facilities],
+                    facilities.categories[key % num_facilities],
+                ): count
+                for key, count in enumerate(counts.tolist())
+                if count > 0
+            }
 
         return summary
 
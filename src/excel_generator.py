@@ -7,11 +7,13 @@ This module generates professional Excel reports with multiple sheets:
 - Professional formatting: fonts, colors, borders, number formats
 """
 
+import numpy as np
 import pandas as pd
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Border, Side, Alignment, NamedStyle
 from openpyxl.utils import get_column_letter
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 import logging
 
 from . import config
@@ -19,6 +21,100 @@ from .utils import log_analysis_step
 
 logger = logging.getLogger(__name__)
 
+# Style objects shared by every sheet, built once at import
+_THIN_SIDE = Side(style="thin")
+_THIN_BORDER = Border(
+    left=_THIN_SIDE, right=_THIN_SIDE, top=_THIN_SIDE, bottom=_THIN_SIDE
+)
+_HEADER_FONT = Font(name="Calibri", size=12, bold=True, color="FFFFFF")
+_HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+_CENTER_ALIGN = Alignment(horizontal="center", vertical="center")
+_TITLE_FONT = Font(name="Calibri", size=16, bold=True)
+
+# Column letters A..BK, so sheets index columns without get_column_letter()
+_LETTERS = [get_column_letter(i) for i in range(1, 64)]
+
+
+def _column_letter(index: int) -> str:
+    """Letter of a 1-based column index."""
+    if index <= len(_LETTERS):
+        return _LETTERS[index - 1]
+    return get_column_letter(index)
+
+
+def _solid_fill(color: str) -> PatternFill:
+    """Solid PatternFill of one color."""
+    return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+
+# Capacity sheet LOS bands: A/B green, C/D yellow, E/F red (one fill per band)
+_GREEN_FILL = _solid_fill("90EE90")
+_YELLOW_FILL = _solid_fill("FFFF00")
+_RED_FILL = _solid_fill("FF6347")
+_LOS_BAND_FILLS = {
+    "A": _GREEN_FILL,
+    "B": _GREEN_FILL,
+    "C": _YELLOW_FILL,
+    "D": _YELLOW_FILL,
+    "E": _RED_FILL,
+    "F": _RED_FILL,
+}
+
+# Comparison sheet: one color per LOS grade
+_LOS_FILLS = {
+    "A": _solid_fill("90EE90"),  # Light green
+    "B": _solid_fill("ADFF2F"),  # Green yellow
+    "C": _solid_fill("FFFF00"),  # Yellow
+    "D": _solid_fill("FFA500"),  # Orange
+    "E": _solid_fill("FF6347"),  # Tomato
+    "F": _solid_fill("FF0000"),  # Red
+}
+
+
+def _los_style_name(fill: PatternFill) -> str:
+    """Name of the registered LOS named style carrying this fill."""
+    return f"scag_los_{fill.fgColor.rgb[-6:]}"
+
+
+# Absolute AM/PM difference columns of the comparison sheet:
+# (new column, metric whose _AM and _PM columns are compared)
+_COMPARISON_DIFFS = (
+    ("Peak_Diff", "Avg_Peak_Total"),
+    ("VC_Ratio_Diff", "Avg_VC_Ratio"),
+    ("Truck_PCT_Diff", "Avg_Truck_PCT"),
+)
+
+# Column style rules of each sheet: the first rule whose keywords occur in
+# the column name picks its named style; other columns get "scag_data"
+_SUMMARY_STYLE_RULES = (
+    (("AADT", "Peak"), "scag_int"),
+    (("PCT",), "scag_pct"),
+    (("VC_Ratio",), "scag_vc"),
+)
+_AADT_STYLE_RULES = (
+    (("AADT", "Peak"), "scag_int"),
+    (("PCT",), "scag_pct"),
+)
+_PEAK_STYLE_RULES = (
+    (("Peak",), "scag_int"),
+    (("PCT",), "scag_pct"),
+)
+_CAPACITY_STYLE_RULES = (
+    (("VC",), "scag_vc"),
+    (("LOS",), "scag_los"),
+)
+_TRUCK_STYLE_RULES = (
+    (("AADT",), "scag_int"),
+    (("PCT",), "scag_pct"),
+    (("Ratio", "Intensity"), "scag_vc"),
+)
+_COMPARISON_STYLE_RULES = (
+    (("Flow",), "scag_int"),
+    (("PCT",), "scag_pct"),
+    (("Ratio", "Intensity"), "scag_vc"),
+    (("Dominant_LOS",), "scag_los"),
+)
+
 
 class ExcelGenerator:
     """
@@ -40,132 +136,269 @@ class ExcelGenerator:
         - Alignment: Center for headers, left for text, right for numbers
     """
 
-    def __init__(self, output_path: str) -> None:
+    def __init__(self, output_path: str, write_only: bool = True) -> None:
         """
         Initialize the Excel Generator.
 
         Args:
             output_path: Path where the Excel file will be saved
+            write_only: If True (default), use an openpyxl write-only workbook,
+                which streams rows to disk instead of keeping every cell in
+                memory. Sheets are built append-only either way; pass False
+                to keep an editable workbook in self.wb. A write-only
+                workbook can be saved once.
 
         Example:
             >>> generator = ExcelGenerator('output/report.xlsx')
         """
 
-        self.wb = Workbook()
+        self.wb = Workbook(write_only=write_only)
         self.output_path = output_path
-        self.wb.remove(self.wb.active)  # Remove default sheet if needed.
+        self._saved = False
+        if not write_only:
+            self.wb.remove(self.wb.active)  # Remove default sheet if needed.
+        self._register_named_styles()
 
-    def _create_header_style(self) -> Dict:
+    def _register_named_styles(self) -> None:
+        """
+        Register the named cell styles used by all sheets.
+
+        Assigning cell.style = "scag_int" is a single lookup, whereas setting
+        font, fill, border and number format separately rebuilds the cell's
+        style on every assignment.
+
+        Styles:
+            scag_title: Calibri 16pt bold, thin border, centered (sheet titles)
+            scag_header: Header font, fill, border and alignment
+            scag_data: Thin border
+            scag_int: Thin border, '#,##0'
+            scag_pct: Thin border, '0.0%'
+            scag_vc: Thin border, '0.00'
+            scag_los: Thin border, centered (LOS grades)
+            scag_los_<RRGGBB>: scag_los with one LOS fill, one per color in
+                _LOS_BAND_FILLS and _LOS_FILLS
         """
-        Create standard header style for all sheets.
+        border = _THIN_BORDER
+        named_styles = [
+            NamedStyle(
+                "scag_title",
+                font=_TITLE_FONT,
+                border=border,
+                alignment=_CENTER_ALIGN,
+            ),
+            NamedStyle(
+                "scag_header",
+                font=_HEADER_FONT,
+                fill=_HEADER_FILL,
+                border=border,
+                alignment=_CENTER_ALIGN,
+            ),
+            NamedStyle("scag_data", border=border),
+            NamedStyle("scag_int", border=border, number_format="#,##0"),
+            NamedStyle("scag_pct", border=border, number_format="0.0%"),
+            NamedStyle("scag_vc", border=border, number_format="0.00"),
+            NamedStyle("scag_los", border=border, alignment=_CENTER_ALIGN),
+        ]
+        los_fills = {
+            _los_style_name(fill): fill
+            for fill in [*_LOS_BAND_FILLS.values(), *_LOS_FILLS.values()]
+        }
+        named_styles.extend(
+            NamedStyle(name, border=border, fill=fill, alignment=_CENTER_ALIGN)
+            for name, fill in los_fills.items()
+        )
+        for style in named_styles:
+            self.wb.add_named_style(style)
 
+    def _set_column_widths(
+        self, worksheet, widths: Union[Dict[str, float], List[float]]
+    ) -> None:
+        """
+        Set column widths for a worksheet.
 
-        Returns:
-            dict: Dictionary containing Font, PatternFill, Border, Alignment objects
-                {
-                    'font': Font(...),
-                    'fill': PatternFill(...),
-                    'border': Border(...),
-                    'alignment': Alignment(...)
-                }
+        Args:
+            worksheet: openpyxl Worksheet object
+            widths: Dictionary mapping column letters to widths
+                    e.g., {'A': 20, 'B': 15, 'C': 12}, or a list of widths
+                    starting at column A, e.g., [20, 15, 12]
 
         Example:
-            >>> generator = ExcelGenerator('output.xlsx')
-            >>> header_style = generator._create_header_style()
-            >>> ws['A1'].font = header_style['font']
-            >>> ws['A1'].fill = header_style['fill']
+            >>> generator._set_column_widths(ws, {'A': 20, 'B': 15, 'C': 12})
+            >>> generator._set_column_widths(ws, [20, 15, 12])
+        """
+        if isinstance(widths, dict):
+            items = widths.items()
+        else:
+            items = ((_column_letter(i), w) for i, w in enumerate(widths, start=1))
 
-        Steps to implement:
-            1. Create Font: Calibri 12pt, Bold, White color
-            2. Create PatternFill: Dark blue (#366092), solid fill
-            3. Create Border: Thin borders on all sides
-            4. Create Alignment: Center horizontal and vertical
-            5. Return dictionary with all style objects
+        column_dimensions = worksheet.column_dimensions
+        for key, value in items:
+            column_dimensions[key].width = value
+
+    def _classify_columns(
+        self,
+        columns: Iterable[str],
+        rules: Sequence[Tuple[Tuple[str, ...], str]],
+    ) -> List[str]:
         """
+        Pick the named style of each column from its name, once per sheet.
 
-        style_dict = {
-            "font": Font(name="Calibri", size=12, bold=True, color="FFFFFF"),
-            "fill": PatternFill(
-                start_color="366092", end_color="366092", fill_type="solid"
-            ),
-            "border": Border(
-                left=Side(style="thin"),
-                right=Side(style="thin"),
-                top=Side(style="thin"),
-                bottom=Side(style="thin"),
-            ),
-            "alignment": Alignment(horizontal="center", vertical="center"),
-        }
-        return style_dict
+        Args:
+            columns: Column names
+            rules: (keywords, style) pairs, checked in order; the first rule
+                with a keyword contained in the column name wins
+
+        Returns:
+            List of named styles, "scag_data" where no rule matches
+
+        Example:
+            >>> generator._classify_columns(["Type", "Avg_AADT"], _AADT_STYLE_RULES)
+            ['scag_data', 'scag_int']
+        """
+        styles = []
+        for column_name in columns:
+            for keywords, style in rules:
+                if any(keyword in column_name for keyword in keywords):
+                    styles.append(style)
+                    break
+            else:
+                styles.append("scag_data")
+        return styles
+
+    def _append_title(self, ws, title: str, merge_range: str) -> None:
+        """
+        Append the sheet title as a styled row and merge it across the table.
+
+        The title is appended rather than assigned to ws["A1"] and the merge
+        range is registered directly, since write-only worksheets have no
+        random cell access or merge_cells().
 
-    def _apply_cell_style(
+        Args:
+            ws: openpyxl Worksheet
+            title: Title text
+            merge_range: Cells spanned by the title, e.g. "A1:I1"
+        """
+        cell = WriteOnlyCell(ws, title)
+        cell.style = "scag_title"
+        ws.append([cell])
+        ws.merged_cells.add(merge_range)
+
+    def _append_table(
         self,
-        cell,
-        font: Optional[Font] = None,
-        fill: Optional[PatternFill] = None,
-        border: Optional[Border] = None,
-        alignment: Optional[Alignment] = None,
-        number_format: Optional[str] = None,
+        ws,
+        data: pd.DataFrame,
+        styles: List[str],
+        los_fills: Optional[Dict[str, PatternFill]] = None,
     ) -> None:
         """
-        Apply styling to a single cell.
+        Append a header row and the data rows of a DataFrame to a worksheet.
 
         Args:
-            cell: openpyxl Cell object
-            font: Font style (optional)
-            fill: Fill style (optional)
-            border: Border style (optional)
-            alignment: Alignment style (optional)
-            number_format: Number format string (optional)
+            ws: openpyxl Worksheet
+            data: DataFrame to write
+            styles: Named style of each column
+            los_fills: Fill by LOS grade for "scag_los" columns (optional)
 
         Example:
-            >>> generator._apply_cell_style(
-            ...     ws['A1'],
-            ...     font=Font(bold=True),
-            ...     fill=PatternFill(start_color='366092', fill_type='solid'),
-            ...     alignment=Alignment(horizontal='center')
-            ... )
+            >>> generator._append_table(ws, df, ["scag_data", "scag_int"])
+        """
+        self._append_rows(
+            ws,
+            data.columns,
+            data.itertuples(index=False, name=None),
+            styles,
+            los_fills,
+        )
 
-        Steps to implement:
-            1. Check if font is provided, apply to cell.font
-            2. Check if fill is provided, apply to cell.fill
-            3. Check if border is provided, apply to cell.border
-            4. Check if alignment is provided, apply to cell.alignment
-            5. Check if number_format is provided, apply to cell.number_format
-        """
-
-        if font is not None:
-            cell.font = font
-        if fill is not None:
-            cell.fill = fill
-        if border is not None:
-            cell.border = border
-        if alignment is not None:
-            cell.alignment = alignment
-        if number_format is not None:
-            cell.number_format = number_format
-
-    def _set_column_widths(self, worksheet, widths: Dict[str, float]) -> None:
+    def _append_rows(
+        self,
+        ws,
+        headers: Sequence[str],
+        rows: Iterable[tuple],
+        styles: List[str],
+        los_fills: Optional[Dict[str, PatternFill]] = None,
+    ) -> None:
         """
-        Set column widths for a worksheet.
+        Append a header row and data rows to a worksheet.
+
+        Each row is built as a list of cells with its style already set and
+        written with a single ws.append(), so no cell is looked up again
+        afterwards. Rows are consumed one at a time, so a generator is never
+        materialized. This also works on write-only worksheets.
 
         Args:
-            worksheet: openpyxl Worksheet object
-            widths: Dictionary mapping column letters to widths
-                    e.g., {'A': 20, 'B': 15, 'C': 12}
+            ws: openpyxl Worksheet
+            headers: Column names
+            rows: Row value tuples, in header order
+            styles: Named style of each column
+            los_fills: Fill by LOS grade for "scag_los" columns (optional)
+        """
+        header_cells = []
+        for column_name in headers:
+            cell = WriteOnlyCell(ws, column_name)
+            cell.style = "scag_header"
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        # LOS grade -> filled named style, so a colored cell is one assignment
+        los_styles = {
+            grade: _los_style_name(fill) for grade, fill in (los_fills or {}).items()
+        }
+        # Style lookup of each column: the LOS styles for LOS columns, else None
+        column_los_styles = [
+            los_styles if los_styles and style == "scag_los" else None
+            for style in styles
+        ]
+
+        for row in rows:
+            cells = []
+            for value, style, value_styles in zip(row, styles, column_los_styles):
+                cell = WriteOnlyCell(ws, value)
+                if value_styles is not None:
+                    style = value_styles.get(value, style)
+                cell.style = style
+                cells.append(cell)
+            ws.append(cells)
+
+    def _write_tabular_sheet(
+        self,
+        sheet_name: str,
+        title: str,
+        data: pd.DataFrame,
+        column_widths: Dict[str, float],
+        style_rules: Sequence[Tuple[Tuple[str, ...], str]],
+        los_fills: Optional[Dict[str, PatternFill]] = None,
+        title_columns: Optional[int] = None,
+    ) -> None:
+        """
+        Write a titled table sheet: title row, header row, then the data.
 
-        Example:
-            >>> generator._set_column_widths(ws, {'A': 20, 'B': 15, 'C': 12})
+        Shared by the AADT, peak hour, capacity, truck and comparison sheets.
+        Widths and freeze panes are set before the first row is appended, so
+        this also works on write-only worksheets.
 
-        Steps to implement:
-            1. Loop through widths dictionary items
-            2. For each column letter and width
-            3. Set worksheet.column_dimensions[column_letter].width = width
+        Args:
+            sheet_name: Name of the new worksheet
+            title: Title text in row 1
+            data: DataFrame written from row 2 (header) on
+            column_widths: Dictionary mapping column letters to widths
+            style_rules: Column style rules passed to _classify_columns()
+            los_fills: Fill by LOS grade for "scag_los" columns (optional)
+            title_columns: Number of columns the title spans
+                (default: one per entry of column_widths)
         """
-        # TODO: Implement this method
-        # Hint: Use worksheet.column_dimensions
-        for key, value in widths.items():
-            worksheet.column_dimensions[key].width = value
+        ws = self.wb.create_sheet(sheet_name)
+        self._set_column_widths(ws, column_widths)
+
+        # freeze title and header rows
+        ws.freeze_panes = "A3"
+
+        last_col = _column_letter(title_columns or len(column_widths))
+        self._append_title(ws, title, f"A1:{last_col}1")
+
+        # Named style of each column, decided once
+        styles = self._classify_columns(data.columns, style_rules)
+        self._append_table(ws, data, styles, los_fills)
 
     def create_summary_sheet(
         self, summary_data: pd.DataFrame, sheet_name: str = "Summary_all"
@@ -186,60 +419,57 @@ class ExcelGenerator:
             >>> summary_df = pd.DataFrame({...})
             >>> generator.create_summary_sheet(summary_df)
 
-        Steps to implement:
+        Steps (see create_summary_sheet_from_rows()):
             1. Log the start of sheet creation
             2. Create new worksheet with sheet_name
-            3. Get header style from _create_header_style()
-            4. Write headers (column names) to first row
-            5. Apply header style to first row
-            6. Write data rows (from DataFrame)
-            7. Apply data formatting:
-               - AADT columns: '#,##0' (integer with thousands separator)
-               - Percentage columns: '0.0%'
-               - VC Ratio columns: '0.00'
-            8. Apply borders to all data cells
-            9. Set column widths appropriately
-            10. Freeze first row (freeze_panes = 'A2')
-            11. Log completion
+            3. Freeze first row (freeze_panes = 'A2') and set column widths
+            4. Pick the named style of each column from its name:
+               - AADT and Peak columns: scag_int ('#,##0')
+               - Percentage columns: scag_pct ('0.0%')
+               - VC Ratio columns: scag_vc ('0.00')
+               - Other columns: scag_data (thin border only)
+            5. Append the header row in the scag_header style
+            6. Append the data rows, each cell carrying its column's style
+            7. Log completion
+        """
+        self.create_summary_sheet_from_rows(
+            summary_data.itertuples(index=False, name=None),
+            summary_data.columns,
+            sheet_name,
+        )
+
+    def create_summary_sheet_from_rows(
+        self,
+        rows: Iterable[tuple],
+        headers: Sequence[str],
+        sheet_name: str = "Summary_all",
+    ) -> None:
+        """
+        Create summary sheet from streamed rows instead of a DataFrame.
+
+        Rows are written as they are produced, so an analyzer can feed the
+        sheet from a generator without building the full summary in memory.
+        Combined with write_only=True, memory stays flat in the row count.
+
+        Args:
+            rows: Row value tuples, in header order
+            headers: Column names (same columns as create_summary_sheet())
+            sheet_name: Name of the sheet (default: "Summary_all")
+
+        Example:
+            >>> rows = ((2019, 1, "N", "ML", 98646, 0.095) for _ in range(3))
+            >>> generator.create_summary_sheet_from_rows(
+            ...     rows, ["Year", "Section", "Direction", "Type", "AADT", "Truck_PCT"]
+            ... )
         """
-        # TODO: Implement this method
-        # Hint 1: Use ws.append() to write rows
-        # Hint 2: Iterate through cells to apply formatting
-        # Hint 3: Use dataframe.values.tolist() to get data rows
         log_analysis_step("Excel Generator", "Start creating summary sheet")
 
         ws = self.wb.create_sheet(sheet_name)
-        header_style = self._create_header_style()
-        ws.append(summary_data.columns)
-        for i in range(len(summary_data.columns)):
-            self._apply_cell_style(
-                ws.cell(row=1, column=i + 1),
-                font=header_style["font"],
-                fill=header_style["fill"],
-                border=header_style["border"],
-                alignment=header_style["alignment"],
-            )
-
-        # Write data rows
-        df_list = summary_data.values.tolist()
-        for row in df_list:
-            ws.append(row)
-
-        # Apply data formatting and apply borders to all data cells
-        num_data_rows = len(summary_data)
-        for row_idx in range(2, 2 + num_data_rows):
-            for col_idx in range(len(summary_data.columns)):
-                cell = ws.cell(row=row_idx, column=col_idx + 1)
-                column_name = summary_data.columns[col_idx]
-
-                if "AADT" in column_name or "Peak" in column_name:
-                    cell.number_format = "#,##0"
-                elif "PCT" in column_name:
-                    cell.number_format = "0.0%"
-                elif "VC_Ratio" in column_name:
-                    cell.number_format = "0.00"
+        columns = list(headers)
 
-        # set the column widths
+        # Freeze the header row and size the columns before any row is
+        # appended; in write-only mode rows are streamed out on append
+        ws.freeze_panes = "A2"
         column_widths = {
             "A": 8,  # Year
             "B": 12,  # Section
@@ -254,11 +484,12 @@ class ExcelGenerator:
             "K": 10,  # LOS_AM
             "L": 10,  # LOS_PM
         }
-
         self._set_column_widths(ws, column_widths)
 
-        # freeze first row
-        ws.freeze_panes = "A2"
+        # Named style of each column, decided once
+        styles = self._classify_columns(columns, _SUMMARY_STYLE_RULES)
+
+        self._append_rows(ws, columns, rows, styles)
 
         log_analysis_step("Excel Generator", "Completed creating summary sheet.")
 
@@ -297,55 +528,6 @@ class ExcelGenerator:
 
         log_analysis_step("Excel Generator", "Start creating AADT sheet")
 
-        ws = self.wb.create_sheet("AADT_Analysis")
-
-        # create a title
-        ws["A1"] = "AADT Analysis by Direction and Facility Type"
-        ws.merge_cells("A1:I1")
-
-        # title formatting
-        title_font = Font(name="Calibri", size=16, bold=True)
-        title_border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
-        )
-        ws["A1"].font = title_font
-        ws["A1"].alignment = Alignment(horizontal="center", vertical="center")
-        ws["A1"].border = title_border
-
-        # header formatting
-        header_style = self._create_header_style()
-        ws.append(aadt_data.columns)
-        for i in range(len(aadt_data.columns)):
-            self._apply_cell_style(
-                ws.cell(row=2, column=i + 1),
-                font=header_style["font"],
-                fill=header_style["fill"],
-                border=header_style["border"],
-                alignment=header_style["alignment"],
-            )
-
-        # Write data rows
-        df_list = aadt_data.values.tolist()
-        for row in df_list:
-            ws.append(row)
-
-        # Apply data formatting and apply borders to all data cells
-        num_data_rows = len(aadt_data)
-        for row_idx in range(3, 3 + num_data_rows):
-            for col_idx in range(len(aadt_data.columns)):
-                cell = ws.cell(row=row_idx, column=col_idx + 1)
-                column_name = aadt_data.columns[col_idx]
-
-                if "AADT" in column_name or "Peak" in column_name:
-                    cell.number_format = "#,##0"
-                elif "PCT" in column_name:
-                    cell.number_format = "0.0%"
-
-                self._apply_cell_style(cell, border=header_style["border"])
-
         # set the column widths
         column_widths = {
             "A": 12,  # Direction
@@ -359,10 +541,13 @@ class ExcelGenerator:
             "I": 15,  # Avg_Truck_PCT
         }
 
-        self._set_column_widths(ws, column_widths)
-
-        # freeze first row
-        ws.freeze_panes = "A3"
+        self._write_tabular_sheet(
+            "AADT_Analysis",
+            "AADT Analysis by Direction and Facility Type",
+            aadt_data,
+            column_widths,
+            _AADT_STYLE_RULES,
+        )
 
         log_analysis_step("Excel Generator", "Completed creating aadt sheet.")
 
@@ -387,55 +572,6 @@ class ExcelGenerator:
 
         log_analysis_step("Excel Generator", "Start creating peak hour sheet")
 
-        ws = self.wb.create_sheet("Peak_Hour_Analysis")
-
-        # create a title
-        ws["A1"] = "Peak Hour Analysis by Period"
-        ws.merge_cells("A1:H1")
-
-        # title formatting
-        title_font = Font(name="Calibri", size=16, bold=True)
-        title_border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
-        )
-        ws["A1"].font = title_font
-        ws["A1"].alignment = Alignment(horizontal="center", vertical="center")
-        ws["A1"].border = title_border
-
-        # header formatting
-        header_style = self._create_header_style()
-        ws.append(peak_data.columns)
-        for i in range(len(peak_data.columns)):
-            self._apply_cell_style(
-                ws.cell(row=2, column=i + 1),
-                font=header_style["font"],
-                fill=header_style["fill"],
-                border=header_style["border"],
-                alignment=header_style["alignment"],
-            )
-
-        # Write data rows
-        df_list = peak_data.values.tolist()
-        for row in df_list:
-            ws.append(row)
-
-        # Apply data formatting and apply borders to all data cells
-        num_data_rows = len(peak_data)
-        for row_idx in range(3, 3 + num_data_rows):
-            for col_idx in range(len(peak_data.columns)):
-                cell = ws.cell(row=row_idx, column=col_idx + 1)
-                column_name = peak_data.columns[col_idx]
-
-                if "Peak" in column_name:
-                    cell.number_format = "#,##0"
-                elif "PCT" in column_name:
-                    cell.number_format = "0.0%"
-
-                self._apply_cell_style(cell, border=header_style["border"])
-
         # set the column widths
         column_widths = {
             "A": 12,  # Direction
@@ -448,10 +584,13 @@ class ExcelGenerator:
             "H": 15,  # Max_Peak_Total
         }
 
-        self._set_column_widths(ws, column_widths)
-
-        # freeze first row
-        ws.freeze_panes = "A3"
+        self._write_tabular_sheet(
+            "Peak_Hour_Analysis",
+            "Peak Hour Analysis by Period",
+            peak_data,
+            column_widths,
+            _PEAK_STYLE_RULES,
+        )
 
         log_analysis_step(
             "Excel Generator", "Completed creating peak hour analysis sheet."
@@ -485,73 +624,6 @@ class ExcelGenerator:
         # Hint: Add conditional formatting for LOS grades
         log_analysis_step("Excel Generator", "Start creating capacity sheet")
 
-        ws = self.wb.create_sheet("Capacity_Analysis")
-
-        # create a title
-        ws["A1"] = "Capacity Analysis by Period"
-        ws.merge_cells("A1:H1")
-
-        # title formatting
-        title_font = Font(name="Calibri", size=16, bold=True)
-        title_border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
-        )
-        ws["A1"].font = title_font
-        ws["A1"].alignment = Alignment(horizontal="center", vertical="center")
-        ws["A1"].border = title_border
-
-        # header formatting
-        header_style = self._create_header_style()
-        ws.append(capacity_data.columns)
-        for i in range(len(capacity_data.columns)):
-            self._apply_cell_style(
-                ws.cell(row=2, column=i + 1),
-                font=header_style["font"],
-                fill=header_style["fill"],
-                border=header_style["border"],
-                alignment=header_style["alignment"],
-            )
-
-        # Write data rows
-        df_list = capacity_data.values.tolist()
-        for row in df_list:
-            ws.append(row)
-
-        # Apply data formatting and apply borders to all data cells
-        num_data_rows = len(capacity_data)
-        for row_idx in range(3, 3 + num_data_rows):
-            for col_idx in range(len(capacity_data.columns)):
-                cell = ws.cell(row=row_idx, column=col_idx + 1)
-                column_name = capacity_data.columns[col_idx]
-
-                if "VC" in column_name:
-                    cell.number_format = "0.00"
-                elif "LOS" in column_name:
-                    cell.alignment = header_style["alignment"]
-                    if cell.value in ["A", "B"]:
-                        cell.fill = PatternFill(
-                            start_color="90EE90",
-                            end_color="90EE90",
-                            fill_type="solid",
-                        )
-                    elif cell.value in ["C", "D"]:
-                        cell.fill = PatternFill(
-                            start_color="FFFF00",
-                            end_color="FFFF00",
-                            fill_type="solid",
-                        )
-                    elif cell.value in ["E", "F"]:
-                        cell.fill = PatternFill(
-                            start_color="FF6347",
-                            end_color="FF6347",
-                            fill_type="solid",
-                        )
-
-                self._apply_cell_style(cell, border=header_style["border"])
-
         # set the column widths
         column_widths = {
             "A": 12,  # Direction
@@ -564,10 +636,15 @@ class ExcelGenerator:
             "H": 12,  # LOS_Counts
         }
 
-        self._set_column_widths(ws, column_widths)
-
-        # freeze first row
-        ws.freeze_panes = "A3"
+        # LOS color coding: A/B green, C/D yellow, E/F red
+        self._write_tabular_sheet(
+            "Capacity_Analysis",
+            "Capacity Analysis by Period",
+            capacity_data,
+            column_widths,
+            _CAPACITY_STYLE_RULES,
+            _LOS_BAND_FILLS,
+        )
 
         log_analysis_step(
             "Excel Generator", "Completed creating capacity analysis sheet."
@@ -594,58 +671,6 @@ class ExcelGenerator:
         # Hint: Follow same pattern as other sheet creation methods
         log_analysis_step("Excel Generator", "Start creating truck analysis sheet")
 
-        ws = self.wb.create_sheet("Truck_Analysis")
-
-        # create a title
-        ws["A1"] = "Truck Analysis"
-        ws.merge_cells("A1:I1")
-
-        # title formatting
-        title_font = Font(name="Calibri", size=16, bold=True)
-        title_border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
-        )
-        ws["A1"].font = title_font
-        ws["A1"].alignment = Alignment(horizontal="center", vertical="center")
-        ws["A1"].border = title_border
-
-        # header formatting
-        header_style = self._create_header_style()
-        ws.append(truck_data.columns)
-        for i in range(len(truck_data.columns)):
-            self._apply_cell_style(
-                ws.cell(row=2, column=i + 1),
-                font=header_style["font"],
-                fill=header_style["fill"],
-                border=header_style["border"],
-                alignment=header_style["alignment"],
-            )
-
-        # Write data rows
-        df_list = truck_data.values.tolist()
-        for row in df_list:
-            ws.append(row)
-
-        # Apply data formatting and apply borders to all data cells
-
-        num_data_rows = len(truck_data)
-        for row_idx in range(3, 3 + num_data_rows):
-            for col_idx in range(len(truck_data.columns)):
-                cell = ws.cell(row=row_idx, column=col_idx + 1)
-                column_name = truck_data.columns[col_idx]
-
-                if "AADT" in column_name:
-                    cell.number_format = "#,##0"
-                elif "PCT" in column_name:
-                    cell.number_format = "0.0%"
-                elif "Ratio" in column_name or "Intensity" in column_name:
-                    cell.number_format = "0.00"
-
-                self._apply_cell_style(cell, border=header_style["border"])
-
         # set the column widths
         column_widths = {
             "A": 12,  # Direction
@@ -659,10 +684,13 @@ class ExcelGenerator:
             "I": 15,  # Max_Truck_PCT
         }
 
-        self._set_column_widths(ws, column_widths)
-
-        # freeze first row
-        ws.freeze_panes = "A3"
+        self._write_tabular_sheet(
+            "Truck_Analysis",
+            "Truck Analysis",
+            truck_data,
+            column_widths,
+            _TRUCK_STYLE_RULES,
+        )
 
         log_analysis_step("Excel Generator", "Completed creating truck analysis sheet.")
 
@@ -703,100 +731,7 @@ class ExcelGenerator:
         # Hint: Use different fill colors for AM (blue) and PM (orange) headers
         log_analysis_step("Excel Generator", "Start creating period comparison sheet")
 
-        ws = self.wb.create_sheet("AM_vs_PM_Comparison")
-
-        merged_df = pd.merge(
-            am_data, pm_data, on=["Direction", "Type"], suffixes=("_AM", "_PM")
-        )
-
-        if "Avg_Peak_Total_AM" in merged_df.columns:
-            merged_df["Peak_Diff"] = (
-                merged_df["Avg_Peak_Total_AM"] - merged_df["Avg_Peak_Total_PM"]
-            ).abs()
-
-        if "Avg_VC_Ratio_AM" in merged_df.columns:
-            merged_df["VC_Ratio_Diff"] = (
-                merged_df["Avg_VC_Ratio_AM"] - merged_df["Avg_VC_Ratio_PM"]
-            ).abs()
-
-        if "Avg_Truck_PCT_AM" in merged_df.columns:
-            merged_df["Truck_PCT_Diff"] = (
-                merged_df["Avg_Truck_PCT_AM"] - merged_df["Avg_Truck_PCT_PM"]
-            ).abs()
-
-        # title formatting
-        title_font = Font(name="Calibri", size=16, bold=True)
-        title_border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
-        )
-
-        # create a title
-        ws["A1"] = "AM and PM comparison metrics"
-        num_cols = len(merged_df.columns)
-        last_col = get_column_letter(num_cols)
-        ws.merge_cells(f"A1:{last_col}1")
-
-        ws["A1"].font = title_font
-        ws["A1"].alignment = Alignment(horizontal="center", vertical="center")
-        ws["A1"].border = title_border
-
-        # header formatting
-        header_style = self._create_header_style()
-        ws.append(merged_df.columns)
-        for i in range(len(merged_df.columns)):
-            self._apply_cell_style(
-                ws.cell(row=2, column=i + 1),
-                font=header_style["font"],
-                fill=header_style["fill"],
-                border=header_style["border"],
-                alignment=header_style["alignment"],
-            )
-
-        # Write data rows
-        df_list = merged_df.values.tolist()
-        for row in df_list:
-            ws.append(row)
-
-        # Apply data formatting and apply borders to all data cells
-
-        # los color settings
-        los_colors = {
-            "A": "90EE90",  # Light green
-            "B": "ADFF2F",  # Green yellow
-            "C": "FFFF00",  # Yellow
-            "D": "FFA500",  # Orange
-            "E": "FF6347",  # Tomato
-            "F": "FF0000",  # Red
-        }
-
-        num_data_rows = len(merged_df)
-        for row_idx in range(3, 3 + num_data_rows):
-            for col_idx in range(len(merged_df.columns)):
-                cell = ws.cell(row=row_idx, column=col_idx + 1)
-                column_name = merged_df.columns[col_idx]
-
-                if "Flow" in column_name:
-                    cell.number_format = "#,##0"
-                elif "PCT" in column_name:
-                    cell.number_format = "0.0%"
-                elif "Ratio" in column_name or "Intensity" in column_name:
-                    cell.number_format = "0.00"
-                elif "Dominant_LOS" in column_name:
-                    cell.alignment = header_style["alignment"]
-                    if cell.value in los_colors:
-                        cell.fill = PatternFill(
-                            start_color=los_colors[cell.value],
-                            end_color=los_colors[cell.value],
-                            fill_type="solid",
-                        )
-
-                self._apply_cell_style(cell, border=header_style["border"])
-
         # set the column widths
-
         column_widths = {
             "A": 12,  # Direction
             "B": 18,  # Type
@@ -812,10 +747,31 @@ class ExcelGenerator:
             "L": 12,  # LOS_Counts_PM
         }
 
-        self._set_column_widths(ws, column_widths)
+        merged_df = pd.merge(
+            am_data, pm_data, on=["Direction", "Type"], suffixes=("_AM", "_PM")
+        )
 
-        # freeze first row
-        ws.freeze_panes = "A3"
+        # Add the difference columns in one assign, computed on the arrays
+        diffs = {
+            diff_col: np.abs(
+                merged_df[f"{metric}_AM"].to_numpy()
+                - merged_df[f"{metric}_PM"].to_numpy()
+            )
+            for diff_col, metric in _COMPARISON_DIFFS
+            if f"{metric}_AM" in merged_df.columns
+        }
+        merged_df = merged_df.assign(**diffs)
+
+        # the title spans every merged column
+        self._write_tabular_sheet(
+            "AM_vs_PM_Comparison",
+            "AM and PM comparison metrics",
+            merged_df,
+            column_widths,
+            _COMPARISON_STYLE_RULES,
+            _LOS_FILLS,
+            title_columns=len(merged_df.columns),
+        )
 
         log_analysis_step(
             "Excel Generator", "Completed creating AM and PM comparison sheet."
@@ -854,47 +810,6 @@ class ExcelGenerator:
         log_analysis_step("Excel Generator", "Start adding metadata sheet")
 
         ws = self.wb.create_sheet("Metadata")
-        header_style = self._create_header_style()
-
-        ws["A1"] = "Analysis Metadata"
-        ws.merge_cells("A1:B1")
-
-        # Title formatting
-        title_font = Font(name="Calibri", size=16, bold=True)
-        title_border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
-        )
-        ws["A1"].font = title_font
-        ws["A1"].alignment = Alignment(horizontal="center", vertical="center")
-        ws["A1"].border = title_border
-
-        ws["A3"] = "Key"
-        ws["B3"] = "Value"
-
-        for col in ["A", "B"]:
-            cell = ws[f"{col}3"]
-            self._apply_cell_style(
-                cell,
-                font=header_style["font"],
-                fill=header_style["fill"],
-                border=header_style["border"],
-                alignment=header_style["alignment"],
-            )
-
-        # fill in metadata from row 4
-        row_num = 4
-        for key, value in metadata.items():
-            ws.cell(row=row_num, column=1, value=key)
-            ws.cell(row=row_num, column=2, value=value)
-
-            for col_idx in [1, 2]:
-                self._apply_cell_style(
-                    ws.cell(row=row_num, column=col_idx), border=header_style["border"]
-                )
-            row_num += 1
 
         column_widths = {
             "A": 25,  # key
@@ -903,12 +818,26 @@ class ExcelGenerator:
 
         self._set_column_widths(ws, column_widths)
 
+        self._append_title(ws, "Analysis Metadata", "A1:B1")
+        ws.append([])
+
+        # key/value table from row 3
+        self._append_rows(
+            ws, ["Key", "Value"], metadata.items(), ["scag_data", "scag_data"]
+        )
+
         log_analysis_step("Excel Generator", "Completed adding metadata sheet")
 
     def save(self) -> None:
         """
         Save the workbook to file.
 
+        Call this once, after all sheets are built: every save re-serializes
+        the whole workbook, and a write-only workbook cannot be saved twice.
+
+        Raises:
+            RuntimeError: If save() was already called on this generator
+
         Example:
             >>> generator.save()
 
@@ -918,9 +847,15 @@ class ExcelGenerator:
             3. Log completion with file path
             4. Handle any save errors
         """
+        if self._saved:
+            raise RuntimeError(
+                f"save() already called; workbook was written to {self.output_path}"
+            )
+
         try:
             log_analysis_step("Excel Generator", f"Saving Excel to {self.output_path}")
             self.wb.save(self.output_path)
+            self._saved = True
             log_analysis_step("Excel Generator", f"Saved Excel to {self.output_path}")
         except PermissionError as e:
             logger.error(
@@ -476,7 +476,7 @@ class TruckAnalyzer:
         log_analysis_step("Truck Analyzer", "Start comparing am and pm truck flows")
 
         grouped_df = (
-            self.df.groupby([config.DIRECTION_FIELD, config.TYPE_FIELD])
+            self.df.groupby([config.DIRECTION_FIELD, config.TYPE_FIELD], observed=True)
             .agg(
                 {
                     "AM_PEAK_TRUCK": "mean",
@@ -556,7 +556,7 @@ class TruckAnalyzer:
         )
 
         grouped_df = (
-            self.df.groupby([config.DIRECTION_FIELD, config.TYPE_FIELD])
+            self.df.groupby([config.DIRECTION_FIELD, config.TYPE_FIELD], observed=True)
             .agg(
                 {
                     "TRUCK_AADT": "mean",
@@ -44,6 +44,39 @@ def get_los_from_vc(vc_ratio: float) -> str:
     return "F"
 
 
+# Ordered LOS grades for LOS columns; 'N/A' marks a missing V/C ratio
+LOS_DTYPE = pd.CategoricalDtype(list(config.LOS_THRESHOLDS) + ["N/A"], ordered=True)
+
+
+def get_los_from_vc_series(vc_ratio: pd.Series) -> pd.Series:
+    """
+    Determine Level of Service (LOS) for a whole column of V/C ratios.
+
+    Vectorized equivalent of get_los_from_vc(): each V/C ratio is located
+    in the sorted config.LOS_THRESHOLDS in one pass instead of one call per row.
+
+    Args:
+        vc_ratio: Series of Volume to Capacity ratios
+
+    Returns:
+        Categorical Series (LOS_DTYPE) of LOS grades (A-F, 'N/A' where V/C is
+        missing)
+
+    Example:
+        >>> get_los_from_vc_series(pd.Series([0.45, 1.05])).tolist()
+        ['B', 'F']
+    """
+    thresholds = np.fromiter(config.LOS_THRESHOLDS.values(), dtype=np.float64)
+
+    # side="left" finds the first threshold >= vc_ratio ("vc_ratio <= threshold");
+    # NaN sorts past every threshold and lands on "N/A". The positions are
+    # the category codes of LOS_DTYPE.
+    codes = np.searchsorted(thresholds, vc_ratio.to_numpy(dtype=np.float64))
+    los = pd.Categorical.from_codes(codes.astype(np.int8), dtype=LOS_DTYPE)
+
+    return pd.Series(los, index=vc_ratio.index)
+
+
 def calculate_period_flow(
     df: pd.DataFrame, period: str, flow_type: str = "total"
 ) -> pd.Series:
@@ -96,27 +129,15 @@ def calculate_aadt(df: pd.DataFrame) -> Tuple[pd.Series, pd.Series, pd.Series]:
         Tuple of (total_aadt, auto_aadt, truck_aadt)
 
     """
-    # Calculate flow for each period
-    am_flow = calculate_period_flow(df, "AM", "total")
-    pm_flow = calculate_period_flow(df, "PM", "total")
-    md_flow = calculate_period_flow(df, "MD", "total")
-    eve_flow = calculate_period_flow(df, "EVE", "total")
-    nt_flow = calculate_period_flow(df, "NT", "total")
-
-    # Total AADT is sum of all period flows
-    total_aadt = am_flow + pm_flow + md_flow + eve_flow + nt_flow
+    # Read the auto and truck fields of all periods as one block and reduce
+    # each half of it (nansum keeps pandas' skip-NaN behaviour)
+    n_auto = len(config.AUTO_FLOW_FIELDS)
+    flows = df[config.AUTO_FLOW_FIELDS + config.TRUCK_FLOW_FIELDS].to_numpy()
+    auto_aadt = pd.Series(np.nansum(flows[:, :n_auto], axis=1), index=df.index)
+    truck_aadt = pd.Series(np.nansum(flows[:, n_auto:], axis=1), index=df.index)
 
-    # Calculate truck AADT
-    am_truck = calculate_period_flow(df, "AM", "truck")
-    pm_truck = calculate_period_flow(df, "PM", "truck")
-    md_truck = calculate_period_flow(df, "MD", "truck")
-    eve_truck = calculate_period_flow(df, "EVE", "truck")
-    nt_truck = calculate_period_flow(df, "NT", "truck")
-
-    truck_aadt = am_truck + pm_truck + md_truck + eve_truck + nt_truck
-
-    # Auto AADT is total minus truck
-    auto_aadt = total_aadt - truck_aadt
+    # Total AADT is auto plus truck
+    total_aadt = auto_aadt + truck_aadt
 
     return total_aadt, auto_aadt, truck_aadt
 
@@ -180,8 +201,9 @@ def calculate_capacity(
 
 
 def calculate_vc_ratio(
-    pce_flow: Union[pd.Series, float], capacity: Union[pd.Series, float]
-) -> Union[pd.Series, float]:
+    pce_flow: Union[pd.Series, np.ndarray, float],
+    capacity: Union[pd.Series, np.ndarray, float],
+) -> Union[pd.Series, np.ndarray, float]:
     """
     Calculate Volume to Capacity (V/C) ratio.
 
@@ -190,11 +212,15 @@ def calculate_vc_ratio(
         capacity: Roadway capacity
 
     Returns:
-        V/C ratio (V/C 比率)
+        V/C ratio (V/C 比率), NaN where there is no capacity
     """
     # Avoid division by zero
     if isinstance(capacity, pd.Series):
         return pce_flow.divide(capacity.replace(0, np.nan))
+    elif isinstance(capacity, np.ndarray):
+        vc_ratio = np.full(np.broadcast(pce_flow, capacity).shape, np.nan)
+        np.divide(pce_flow, capacity, out=vc_ratio, where=capacity > 0)
+        return vc_ratio
     else:
         return pce_flow / capacity if capacity > 0 else np.nan
 
@@ -214,13 +240,13 @@ def aggregate_by_direction_facility(
         Aggregated DataFrame
     """
     if method == "mean":
-        grouped = df.groupby([config.DIRECTION_FIELD, config.TYPE_FIELD])[
-            value_column
-        ].mean()
+        grouped = df.groupby(
+            [config.DIRECTION_FIELD, config.TYPE_FIELD], observed=True
+        )[value_column].mean()
     elif method == "sum":
-        grouped = df.groupby([config.DIRECTION_FIELD, config.TYPE_FIELD])[
-            value_column
-        ].sum()
+        grouped = df.groupby(
+            [config.DIRECTION_FIELD, config.TYPE_FIELD], observed=True
+        )[value_column].sum()
     else:
         raise ValueError(f"Invalid method: {method}. Must be 'mean' or 'sum'")
 
@@ -238,6 +264,26 @@ def validate_data(
         column: Column name to validate
         range_key: Key in VALIDATION_RANGES config
 
+    Returns:
+        Tuple of (is_valid, error_messages)
+    """
+    return validate_values(df[column].to_numpy(), column, range_key)
+
+
+def validate_values(
+    values: np.ndarray, column: str, range_key: str
+) -> Tuple[bool, List[str]]:
+    """
+    Validate an array of values is within reasonable ranges.
+
+    Same checks as validate_data() for values that are already an ndarray,
+    e.g. a freshly computed column before it is added to a DataFrame.
+
+    Args:
+        values: Values to validate
+        column: Column name used in the error messages
+        range_key: Key in VALIDATION_RANGES config
+
     Returns:
         Tuple of (is_valid, error_messages)
     """
@@ -250,19 +296,17 @@ def validate_data(
     min_val = config.VALIDATION_RANGES[range_key]["min"]
     max_val = config.VALIDATION_RANGES[range_key]["max"]
 
-    # Check for values outside range
-    below_min = df[column] < min_val
-    above_max = df[column] > max_val
+    # Check for values outside range (NaN is neither below nor above)
+    below_min = np.count_nonzero(values < min_val)
+    above_max = np.count_nonzero(values > max_val)
 
-    if below_min.any():
+    if below_min:
         is_valid = False
-        count = below_min.sum()
-        errors.append(f"{count} values in '{column}' below minimum ({min_val})")
+        errors.append(f"{below_min} values in '{column}' below minimum ({min_val})")
 
-    if above_max.any():
+    if above_max:
         is_valid = False
-        count = above_max.sum()
-        errors.append(f"{count} values in '{column}' above maximum ({max_val})")
+        errors.append(f"{above_max} values in '{column}' above maximum ({max_val})")
 
     return is_valid, errors
 
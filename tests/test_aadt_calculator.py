@@ -0,0 +1,167 @@
+"""
+Unit tests for AADTCalculator class
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from src import config
+from src.data_loader import DataLoader
+from src.aadt_calculator import AADTCalculator
+
+
+@pytest.fixture
+def section_df():
+    """Section 1 (2019) data as loaded"""
+    return DataLoader().load_section_data(2019, 1)
+
+
+def make_segments(auto, truck, dtype="int64"):
+    """
+    Segments with one auto and one truck flow per row, all other periods 0.
+
+    Rows alternate N/S and ML/HV so every direction/type group has segments.
+    """
+    n = len(auto)
+    data = {
+        config.DIRECTION_FIELD: (["N", "N", "S", "S"] * n)[:n],
+        config.TYPE_FIELD: (["ML", "HV"] * n)[:n],
+    }
+    for field in config.AUTO_FLOW_FIELDS + config.TRUCK_FLOW_FIELDS:
+        data[field] = np.zeros(n, dtype=dtype)
+    data[config.AUTO_FLOW_FIELDS[0]] = np.asarray(auto, dtype=dtype)
+    data[config.TRUCK_FLOW_FIELDS[0]] = np.asarray(truck, dtype=dtype)
+    return pd.DataFrame(data)
+
+
+class TestAADTCalculator:
+    """Test cases for AADTCalculator class"""
+
+    def test_all_groups_order_and_keys(self, section_df):
+        """Test groups follow first appearance of direction, then type, as str"""
+        calculator = AADTCalculator(section_df)
+        calculator.calculate_segment_aadt()
+        summary_df = calculator.calculate_all_groups()
+
+        directions = list(dict.fromkeys(section_df["DIRECT"].astype(str)))
+        types = list(dict.fromkeys(section_df["TYPE"].astype(str)))
+        observed = set(
+            zip(section_df["DIRECT"].astype(str), section_df["TYPE"].astype(str))
+        )
+        expected = [(d, t) for d in directions for t in types if (d, t) in observed]
+
+        assert list(zip(summary_df["direction"], summary_df["type"])) == expected
+        assert summary_df["direction"].dtype == object
+        assert summary_df["type"].dtype == object
+
+    def test_all_groups_returns_copy(self, section_df):
+        """Test editing the all-groups summary does not change later calls"""
+        calculator = AADTCalculator(section_df)
+        calculator.calculate_segment_aadt()
+        expected = calculator.calculate_all_groups().copy()
+
+        edited = calculator.calculate_all_groups()
+        edited["total_aadt"] = -1.0
+
+        pd.testing.assert_frame_equal(calculator.calculate_all_groups(), expected)
+
+    def test_all_groups_match_per_group(self, section_df):
+        """Test the single groupby pass agrees with per-group segment averages"""
+        calculator = AADTCalculator(section_df)
+        segment_df = calculator.calculate_segment_aadt()
+        summary_df = calculator.calculate_all_groups()
+
+        assert summary_df["num_segments"].sum() == len(segment_df)
+        for row in summary_df.itertuples(index=False):
+            group = segment_df[
+                (segment_df[config.DIRECTION_FIELD] == row.direction)
+                & (segment_df[config.TYPE_FIELD] == row.type)
+            ]
+            assert row.num_segments == len(group)
+            assert row.total_aadt == pytest.approx(group["TOTAL_AADT"].mean())
+            assert row.auto_aadt == pytest.approx(group["AUTO_AADT"].mean())
+            assert row.truck_aadt == pytest.approx(group["TRUCK_AADT"].mean())
+            assert row.truck_pct == pytest.approx(group["TRUCK_PCT"].mean())
+            assert row.min_aadt == group["TOTAL_AADT"].min()
+            assert row.max_aadt == group["TOTAL_AADT"].max()
+
+            single = calculator.calculate_group_average_aadt(row.direction, row.type)
+            assert single["num_segments"] == row.num_segments
+            assert single["avg_total_aadt"] == pytest.approx(row.total_aadt)
+
+    def test_caches_reset_on_recalculation(self):
+        """Test cached group results follow new flows after recalculation"""
+        calculator = AADTCalculator(make_segments([100] * 8, [10] * 8))
+        calculator.calculate_segment_aadt()
+        before_groups = calculator.calculate_all_groups()
+        before_stats = calculator.get_summary_stats()
+        assert before_stats["avg_aadt"] == pytest.approx(110)
+
+        auto_field = config.AUTO_FLOW_FIELDS[0]
+        calculator.df[auto_field] = calculator.df[auto_field] * 2
+        calculator.calculate_segment_aadt()
+        assert calculator._group_results is None
+        assert calculator._summary_df is None
+        assert calculator._summary_stats is None
+
+        after_groups = calculator.calculate_all_groups()
+        assert (after_groups["total_aadt"] == 210).all()
+        assert (before_groups["total_aadt"] == 110).all()
+        assert calculator.get_summary_stats()["avg_aadt"] == pytest.approx(210)
+        assert calculator.calculate_group_average_aadt("N", "ML")[
+            "avg_total_aadt"
+        ] == pytest.approx(210)
+
+    def test_integer_aadt_stored_as_int32(self):
+        """Test integer volumes that fit are stored as int32"""
+        calculator = AADTCalculator(make_segments([100, 200], [10, 20]))
+        segment_df = calculator.calculate_segment_aadt()
+
+        for col in ("TOTAL_AADT", "AUTO_AADT", "TRUCK_AADT"):
+            assert segment_df[col].dtype == np.int32
+        assert segment_df["TOTAL_AADT"].tolist() == [110, 220]
+
+    def test_aadt_cast_skipped_when_not_int32(self):
+        """Test float flows and volumes beyond int32 keep their dtype"""
+        float_df = make_segments([100.5, 200.25], [10.0, 20.0], dtype="float64")
+        segment_df = AADTCalculator(float_df).calculate_segment_aadt()
+        assert segment_df["TOTAL_AADT"].dtype == np.float64
+        assert segment_df["TOTAL_AADT"].tolist() == [110.5, 220.25]
+
+        big = np.iinfo(np.int32).max
+        segment_df = AADTCalculator(
+            make_segments([big, 1], [1, 1])
+        ).calculate_segment_aadt()
+        assert segment_df["TOTAL_AADT"].dtype == np.int64
+        assert segment_df["TOTAL_AADT"].iloc[0] == big + 1
+
+    def test_truck_pct_zero_total(self):
+        """Test segments with no traffic get TRUCK_PCT 0 instead of NaN"""
+        calculator = AADTCalculator(make_segments([0, 90, 0], [0, 10, 5]))
+        segment_df = calculator.calculate_segment_aadt()
+
+        assert segment_df["TRUCK_PCT"].dtype == np.float64
+        assert segment_df["TRUCK_PCT"].tolist() == [0.0, 10.0, 100.0]
+
+    def test_summary_stats_returns_copy(self):
+        """Test editing the summary stats does not change later calls"""
+        calculator = AADTCalculator(make_segments([100] * 4, [10] * 4))
+        calculator.calculate_segment_aadt()
+        stats = calculator.get_summary_stats()
+        stats["avg_aadt"] = -1.0
+
+        assert calculator.get_summary_stats()["avg_aadt"] == pytest.approx(110)
+
+    def test_init_without_group_fields(self):
+        """Test construction works when direction/type fields are absent"""
+        df = make_segments([100, 200], [10, 20]).drop(
+            columns=[config.DIRECTION_FIELD, config.TYPE_FIELD]
+        )
+        segment_df = AADTCalculator(df).calculate_segment_aadt()
+
+        assert segment_df["TOTAL_AADT"].tolist() == [110, 220]
+
+
+if __name__ == "__main__":
+    # Allow running this file directly
+    pytest.main([__file__, "-v"])
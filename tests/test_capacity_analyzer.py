@@ -0,0 +1,132 @@
+"""
+Unit tests for CapacityAnalyzer class
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from src.data_loader import DataLoader
+from src.aadt_calculator import AADTCalculator
+from src.peak_hour_analyzer import PeakHourAnalyzer
+from src.capacity_analyzer import CapacityAnalyzer
+from src.utils import (
+    LOS_DTYPE,
+    calculate_vc_ratio,
+    get_los_from_vc,
+    get_los_from_vc_series,
+)
+
+
+@pytest.fixture
+def capacity_df():
+    """Section 1 (2019) data with AADT and peak flows calculated"""
+    loader = DataLoader()
+    df = loader.load_section_data(2019, 1)
+    df = AADTCalculator(df).calculate_segment_aadt()
+    return PeakHourAnalyzer(df).calculate_segment_peak_flows()
+
+
+class TestCapacityAnalyzer:
+    """Test cases for CapacityAnalyzer class"""
+
+    def test_los_series_matches_scalar(self):
+        """Test vectorized LOS agrees with get_los_from_vc, including thresholds"""
+        vc = pd.Series([0.0, 0.35, 0.36, 0.54, 0.77, 0.93, 1.0, 1.01, np.inf, np.nan])
+        expected = [get_los_from_vc(v) for v in vc]
+        assert get_los_from_vc_series(vc).tolist() == expected
+
+    def test_vc_ratio_array_matches_series(self):
+        """Test the ndarray V/C path agrees with the Series path, NaN at 0"""
+        pce_flow = pd.Series([1500.0, 900.0, 300.0])
+        capacity = pd.Series([2000, 0, 1000])
+
+        from_series = calculate_vc_ratio(pce_flow, capacity)
+        from_arrays = calculate_vc_ratio(pce_flow.to_numpy(), capacity.to_numpy())
+
+        np.testing.assert_allclose(from_arrays, from_series.to_numpy())
+        assert np.isnan(from_arrays[1])
+
+    def test_segment_los(self, capacity_df):
+        """Test segment LOS matches the V/C ratio of each segment"""
+        analyzer = CapacityAnalyzer(capacity_df)
+        result_df = analyzer.calculate_all_periods_capacity()
+
+        for period in ["AM", "PM"]:
+            assert result_df[f"{period}_LOS"].dtype == LOS_DTYPE
+            expected = result_df[f"{period}_VC_RATIO"].map(get_los_from_vc)
+            assert result_df[f"{period}_LOS"].astype(str).tolist() == expected.tolist()
+
+    def test_all_groups_match_single_group(self, capacity_df):
+        """Test the all-groups summary agrees with calculate_group_capacity"""
+        analyzer = CapacityAnalyzer(capacity_df)
+        analyzer.calculate_all_periods_capacity()
+        summary_df = analyzer.calculate_all_groups_capacity("AM")
+
+        assert not summary_df.empty
+        for row in summary_df.to_dict("records"):
+            expected = analyzer.calculate_group_capacity(
+                row["direction"], row["type"], "AM"
+            )
+            assert row["num_segments"] == expected["num_segments"]
+            assert row["avg_vc_ratio"] == pytest.approx(expected["avg_vc_ratio"])
+            assert row["max_vc_ratio"] == pytest.approx(expected["max_vc_ratio"])
+            assert row["dominant_los"] == expected["dominant_los"]
+            assert row["los_counts"] == expected["los_counts"]
+
+    def test_all_groups_returns_copy(self, capacity_df):
+        """Test editing a cached group summary does not change later calls"""
+        analyzer = CapacityAnalyzer(capacity_df)
+        analyzer.calculate_all_periods_capacity()
+        expected = analyzer.calculate_all_groups_capacity("AM").copy()
+        expected["los_counts"] = expected["los_counts"].map(dict)
+
+        edited = analyzer.calculate_all_groups_capacity("AM")
+        edited["avg_vc_ratio"] = -1.0
+        edited["los_counts"].iloc[0]["A"] = -1
+
+        pd.testing.assert_frame_equal(
+            analyzer.calculate_all_groups_capacity("AM"), expected
+        )
+
+    def test_over_capacity_uses_vc_ratio(self, capacity_df):
+        """Test segments over capacity are counted from V/C, not LOS labels"""
+        result_df = CapacityAnalyzer(capacity_df).calculate_all_periods_capacity()
+        stale_df = result_df.assign(AM_LOS="A")
+        distribution = CapacityAnalyzer(stale_df).get_los_distribution("AM")
+
+        expected = (result_df["AM_VC_RATIO"] > 1.0).sum()
+        assert distribution["segments_over_capacity"] == expected
+
+    def test_identify_bottlenecks(self, capacity_df):
+        """Test bottlenecks exceed the threshold and are sorted by V/C ratio"""
+        analyzer = CapacityAnalyzer(capacity_df)
+        result_df = analyzer.calculate_all_periods_capacity()
+        bottlenecks = analyzer.identify_bottlenecks("AM", vc_threshold=0.85)
+
+        assert list(bottlenecks.columns[:2]) == ["direction", "type"]
+        assert len(bottlenecks) == (result_df["AM_VC_RATIO"] > 0.85).sum()
+        assert (bottlenecks["AM_VC_RATIO"] > 0.85).all()
+        assert bottlenecks["AM_VC_RATIO"].is_monotonic_decreasing
+
+    def test_string_los_input(self, capacity_df):
+        """Test precomputed LOS columns holding plain strings are summarized"""
+        result_df = CapacityAnalyzer(capacity_df).calculate_all_periods_capacity()
+        expected = CapacityAnalyzer(result_df)
+
+        string_df = result_df.astype({"AM_LOS": str, "PM_LOS": str})
+        analyzer = CapacityAnalyzer(string_df)
+
+        distribution = analyzer.get_los_distribution("AM")
+        assert distribution == expected.get_los_distribution("AM")
+
+        group = analyzer.calculate_group_capacity("N", "ML", "PM")
+        assert group == expected.calculate_group_capacity("N", "ML", "PM")
+        pd.testing.assert_frame_equal(
+            analyzer.calculate_all_groups_capacity("AM"),
+            expected.calculate_all_groups_capacity("AM"),
+        )
+
+
+if __name__ == "__main__":
+    # Allow running this file directly
+    pytest.main([__file__, "-v"])
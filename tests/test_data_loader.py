@@ -4,6 +4,7 @@ Unit tests for DataLoader class
 
 import pytest
 import pandas as pd
+from src import config
 from src.data_loader import DataLoader
 
 
@@ -46,6 +47,76 @@ class TestDataLoader:
         # LENGTH should be numeric
         assert pd.api.types.is_numeric_dtype(df["LENGTH"])
 
+    def test_cached_section_is_not_shared(self):
+        """Test repeated loads reuse the parsed file but not the frame"""
+        loader = DataLoader()
+        df1 = loader.load_section_data(2019, 1)
+        df1["LENGTH"] = 0.0
+        df1["EXTRA"] = 1
+
+        df2 = loader.load_section_data(2019, 1)
+        assert df2 is not df1
+        assert "EXTRA" not in df2.columns
+        assert (df2["LENGTH"] > 0).any()
+
+    def test_load_only_analysis_fields(self):
+        """Test all columns are kept by default and all_columns=False trims them"""
+        df = DataLoader(all_columns=False).load_section_data(2019, 1)
+        assert set(df.columns) == set(config.LOAD_FIELDS) | {"YEAR", "SECTION"}
+        assert isinstance(df[config.DIRECTION_FIELD].dtype, pd.CategoricalDtype)
+
+        df_all = DataLoader().load_section_data(2019, 1)
+        assert set(df.columns) < set(df_all.columns)
+        assert len(df_all) == len(df)
+        pd.testing.assert_frame_equal(df, df_all[df.columns])
+
+    def test_id_is_downcast_after_parsing(self, tmp_path):
+        """Test a blank ID is loaded instead of failing the int32 parse"""
+        source = DataLoader(all_columns=False).load_section_data(2019, 1)
+        raw = source.drop(columns=["YEAR", "SECTION"]).head(3).astype({"ID": "Int64"})
+        raw.loc[1, "ID"] = pd.NA
+        filename = config.INPUT_FILE_PATTERN.format(year=2019, section=1)
+        raw.to_csv(tmp_path / filename, index=False)
+
+        df = DataLoader(data_dir=str(tmp_path)).load_section_data(2019, 1)
+        assert df["ID"].isna().tolist() == [False, True, False]
+
+    def test_filter_copy_is_opt_in(self):
+        """Test filters select the matching rows and copy only on request"""
+        loader = DataLoader()
+        df = loader.load_section_data(2019, 1)
+
+        northbound = loader.filter_by_direction(df, "N")
+        assert len(northbound) == (df[config.DIRECTION_FIELD] == "N").sum()
+        assert (northbound[config.DIRECTION_FIELD] == "N").all()
+
+        managed = loader.filter_by_facility(df, "ML", copy=True)
+        managed.loc[:, "LENGTH"] = -1.0
+        assert (df["LENGTH"] >= 0).all()
+
+    def test_float_flows_keep_float64(self, tmp_path):
+        """Test float flow fields are not downcast, so AADT sums keep precision"""
+        source = DataLoader(all_columns=False).load_section_data(2019, 1)
+        raw = source.drop(columns=["YEAR", "SECTION"])
+        flow_fields = config.AUTO_FLOW_FIELDS + config.TRUCK_FLOW_FIELDS
+        raw[flow_fields] = raw[flow_fields].astype("float64") + 0.25
+        filename = config.INPUT_FILE_PATTERN.format(year=2019, section=1)
+        raw.to_csv(tmp_path / filename, index=False)
+
+        df = DataLoader(data_dir=str(tmp_path)).load_section_data(2019, 1)
+        assert (df[flow_fields].dtypes == "float64").all()
+        assert df["ID"].dtype == "int32"
+
+    def test_load_all_sections_concat(self):
+        """Test the concatenated frame holds every section's rows"""
+        loader = DataLoader()
+        sections = loader.load_all_sections(2019)
+        df = loader.load_all_sections_concat(2019)
+
+        assert len(df) == sum(len(section_df) for section_df in sections.values())
+        assert set(df["SECTION"]) == set(sections)
+        assert isinstance(df[config.DIRECTION_FIELD].dtype, pd.CategoricalDtype)
+
 
 if __name__ == "__main__":
     # Allow running this file directly
@@ -0,0 +1,162 @@
+"""
+Unit tests for ExcelGenerator class
+"""
+
+import pytest
+import pandas as pd
+from openpyxl import load_workbook
+from src.excel_generator import ExcelGenerator
+
+
+@pytest.fixture
+def report_frames():
+    """Small analysis results for every sheet"""
+    groups = {"Direction": ["N", "S"], "Type": ["ML", "HV"]}
+    return {
+        "summary": pd.DataFrame(
+            {
+                "Year": [2019, 2019],
+                "AADT": [98646, 12345],
+                "Truck_PCT": [0.095, 0.12],
+                "VC_Ratio_AM": [0.81, 1.05],
+            }
+        ),
+        "aadt": pd.DataFrame(
+            {**groups, "Num_Segments": [9, 4], "Avg_AADT": [98646.4, 12345.0]}
+        ),
+        "peak": pd.DataFrame(
+            {**groups, "Period": ["AM", "AM"], "Avg_Peak_Total": [5000.2, 800.0]}
+        ),
+        "capacity": pd.DataFrame(
+            {**groups, "Avg_VC_Ratio": [0.5, 1.2], "Dominant_LOS": ["B", "F"]}
+        ),
+        "truck": pd.DataFrame(
+            {**groups, "Avg_Truck_AADT": [9412, 800], "Avg_Truck_PCT": [0.095, 0.06]}
+        ),
+        "am": pd.DataFrame(
+            {
+                **groups,
+                "Avg_PCE_Flow": [4000.0, 700.0],
+                "Avg_VC_Ratio": [0.8, 0.3],
+                "Dominant_LOS": ["D", "A"],
+            }
+        ),
+        "pm": pd.DataFrame(
+            {
+                **groups,
+                "Avg_PCE_Flow": [4500.0, 650.0],
+                "Avg_VC_Ratio": [0.9, 0.25],
+                "Dominant_LOS": ["E", "A"],
+            }
+        ),
+    }
+
+
+def build_report(output_path, frames, write_only):
+    """Write every sheet and the metadata, then save"""
+    generator = ExcelGenerator(str(output_path), write_only=write_only)
+    generator.create_summary_sheet(frames["summary"])
+    generator.create_aadt_sheet(frames["aadt"])
+    generator.create_peak_hour_sheet(frames["peak"])
+    generator.create_capacity_sheet(frames["capacity"])
+    generator.create_truck_sheet(frames["truck"])
+    generator.create_comparison_sheet(frames["am"], frames["pm"])
+    generator.add_metadata_sheet({"model": "SCAG 2024 ABM", "base_year": 2019})
+    generator.save()
+    return generator
+
+
+def row_values(ws, row):
+    """Values of one worksheet row, without trailing empty cells"""
+    values = [cell.value for cell in ws[row]]
+    while values and values[-1] is None:
+        values.pop()
+    return values
+
+
+class TestExcelGenerator:
+    """Test cases for ExcelGenerator class"""
+
+    @pytest.mark.parametrize("write_only", [True, False])
+    def test_sheets_round_trip(self, tmp_path, report_frames, write_only):
+        """Test saved sheets keep headers, formats, LOS fills, titles and panes"""
+        output_path = tmp_path / "report.xlsx"
+        build_report(output_path, report_frames, write_only)
+        wb = load_workbook(output_path)
+
+        assert wb.sheetnames == [
+            "Summary_all",
+            "AADT_Analysis",
+            "Peak_Hour_Analysis",
+            "Capacity_Analysis",
+            "Truck_Analysis",
+            "AM_vs_PM_Comparison",
+            "Metadata",
+        ]
+
+        # Summary: header in row 1, no title
+        ws = wb["Summary_all"]
+        assert ws.freeze_panes == "A2"
+        assert row_values(ws, 1) == list(report_frames["summary"].columns)
+        assert [cell.number_format for cell in ws[2]] == [
+            "General",
+            "#,##0",
+            "0.0%",
+            "0.00",
+        ]
+        assert ws["A1"].fill.fgColor.rgb == "00366092"
+
+        # Titled sheets: merged title in row 1, header in row 2, data from row 3
+        titled = {
+            "AADT_Analysis": ("aadt", "A1:I1"),
+            "Peak_Hour_Analysis": ("peak", "A1:H1"),
+            "Capacity_Analysis": ("capacity", "A1:H1"),
+            "Truck_Analysis": ("truck", "A1:I1"),
+            "AM_vs_PM_Comparison": (None, "A1:I1"),
+        }
+        for sheet_name, (frame_key, merge_range) in titled.items():
+            ws = wb[sheet_name]
+            assert ws.freeze_panes == "A3"
+            assert [str(r) for r in ws.merged_cells.ranges] == [merge_range]
+            assert ws["A1"].font.sz == 16 and ws["A1"].font.b
+            if frame_key is not None:
+                assert row_values(ws, 2) == list(report_frames[frame_key].columns)
+
+        assert wb["AADT_Analysis"]["D3"].number_format == "#,##0"
+        assert wb["Peak_Hour_Analysis"]["D3"].number_format == "#,##0"
+        assert wb["Truck_Analysis"]["D3"].number_format == "0.0%"
+
+        # Capacity LOS bands: B green, F red
+        ws = wb["Capacity_Analysis"]
+        assert ws["C3"].number_format == "0.00"
+        assert ws["D3"].fill.fgColor.rgb == "0090EE90"
+        assert ws["D4"].fill.fgColor.rgb == "00FF6347"
+        assert ws["D3"].alignment.horizontal == "center"
+
+        # Comparison: AM and PM side by side plus the V/C difference
+        ws = wb["AM_vs_PM_Comparison"]
+        header = row_values(ws, 2)
+        assert header[:2] == ["Direction", "Type"]
+        assert header[-1] == "VC_Ratio_Diff"
+        los_am = header.index("Dominant_LOS_AM") + 1
+        los_pm = header.index("Dominant_LOS_PM") + 1
+        assert ws.cell(row=3, column=los_am).fill.fgColor.rgb == "00FFA500"
+        assert ws.cell(row=3, column=los_pm).fill.fgColor.rgb == "00FF6347"
+        assert ws.cell(row=3, column=len(header)).value == pytest.approx(0.1)
+
+        # Metadata: title, blank row, key/value table
+        ws = wb["Metadata"]
+        assert [str(r) for r in ws.merged_cells.ranges] == ["A1:B1"]
+        assert row_values(ws, 3) == ["Key", "Value"]
+        assert row_values(ws, 4) == ["model", "SCAG 2024 ABM"]
+
+    def test_save_only_once(self, tmp_path, report_frames):
+        """Test a second save() is refused"""
+        generator = build_report(tmp_path / "report.xlsx", report_frames, True)
+        with pytest.raises(RuntimeError):
+            generator.save()
+
+
+if __name__ == "__main__":
+    # Allow running this file directly
+    pytest.main([__file__, "-v"])